@@ -0,0 +1,155 @@
+"""Micro-benchmark of DeviceStatus decoding.
+
+Compares the current DeviceStatus (lookup-table enum decoding, __slots__)
+against the previous implementation (linear enum scan, per-instance __dict__)
+for decode time and retained memory.
+
+    python benchmarks/device_status_decode.py
+"""
+
+import sys
+import timeit
+import tracemalloc
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Union, cast
+
+INTEGRATION_DIR = Path(__file__).resolve().parents[1] / "custom_components"
+sys.path.insert(0, str(INTEGRATION_DIR / "panasonic_eolia"))
+
+from eolia.responses import (
+    AIControl,
+    AirFlow,
+    AirQualityName,
+    DeviceStatus,
+    OperationMode,
+    WindDirection,
+    WindDirectionHorizon,
+    WindShieldHit,
+    WindVolume,
+)
+
+SAMPLE = {
+    "appliance_id": "0123456789abcdef",
+    "operation_status": True,
+    "operation_mode": "Cooling",
+    "temperature": 26.0,
+    "wind_volume": 0,
+    "wind_direction": 0,
+    "inside_humidity": 999,
+    "inside_temp": 27.0,
+    "outside_temp": 999.0,
+    "operation_priority": False,
+    "timer_value": 0,
+    "device_errstatus": False,
+    "airquality": False,
+    "nanoex": True,
+    "aq_value": -1,
+    "aq_name": "",
+    "ai_control": "off",
+    "air_flow": "not_set",
+    "wind_shield_hit": "not_set",
+    "wind_direction_horizon": "auto",
+    "operation_token": "token",
+}
+
+FLEET_SIZE = 10_000
+ROUNDS = 20_000
+
+
+class LegacyDeviceStatus:
+    """DeviceStatus as it decoded before the lookup tables and __slots__."""
+
+    def __init__(self, **kwargs):
+        self.appliance_id = kwargs.get("appliance_id")
+        self.operation_status = kwargs.get("operation_status")
+        self.operation_mode = cast(
+            Optional[Union[OperationMode, str]],
+            self._parse_enum(kwargs.get("operation_mode"), OperationMode),
+        )
+        self.temperature = kwargs.get("temperature")
+        self.inside_humidity = kwargs.get("inside_humidity")
+        self.inside_temp = kwargs.get("inside_temp")
+        self.outside_temp = kwargs.get("outside_temp")
+        self.operation_priority = kwargs.get("operation_priority")
+        self.timer_value = kwargs.get("timer_value")
+        self.device_errstatus = kwargs.get("device_errstatus")
+        self.airquality = kwargs.get("airquality")
+        self.nanoex = kwargs.get("nanoex")
+        self.aq_value = kwargs.get("aq_value")
+        self.wind_volume = cast(
+            Optional[Union[WindVolume, int]],
+            self._parse_enum(kwargs.get("wind_volume"), WindVolume),
+        )
+        self.wind_direction = cast(
+            Optional[Union[WindDirection, str]],
+            self._parse_enum(kwargs.get("wind_direction"), WindDirection),
+        )
+        self.aq_name = cast(
+            Optional[Union[AirQualityName, str]],
+            self._parse_enum(kwargs.get("aq_name"), AirQualityName),
+        )
+        self.ai_control = cast(
+            Optional[Union[AIControl, str]],
+            self._parse_enum(kwargs.get("ai_control"), AIControl),
+        )
+        self.air_flow = cast(
+            Optional[Union[AirFlow, str]],
+            self._parse_enum(kwargs.get("air_flow"), AirFlow),
+        )
+        self.wind_shield_hit = cast(
+            Optional[Union[WindShieldHit, str]],
+            self._parse_enum(kwargs.get("wind_shield_hit"), WindShieldHit),
+        )
+        self.wind_direction_horizon = cast(
+            Optional[Union[WindDirectionHorizon, str]],
+            self._parse_enum(
+                kwargs.get("wind_direction_horizon"), WindDirectionHorizon
+            ),
+        )
+        self.operation_token = kwargs.get("operation_token")
+
+    def _parse_enum(self, value, enum_class):
+        if value is None:
+            return None
+        for enum_member in enum_class:
+            if enum_member.value == value:
+                return enum_member
+        return value
+
+
+def check_equivalent():
+    current = DeviceStatus(**SAMPLE)
+    legacy = LegacyDeviceStatus(**SAMPLE)
+    for name in DeviceStatus.__slots__:
+        assert getattr(current, name) == getattr(legacy, name), name
+        if isinstance(getattr(legacy, name), Enum):
+            assert getattr(current, name) is getattr(legacy, name), name
+
+
+def decode_time(cls):
+    return min(timeit.repeat(lambda: cls(**SAMPLE), number=ROUNDS, repeat=5))
+
+
+def retained_memory(cls):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    fleet = [cls(**SAMPLE) for _ in range(FLEET_SIZE)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del fleet
+    return size
+
+
+def main():
+    check_equivalent()
+    print(f"{'':10} {'decode us':>10} {'bytes/status':>13}")
+    for label, cls in (("legacy", LegacyDeviceStatus), ("current", DeviceStatus)):
+        per_call = decode_time(cls) / ROUNDS * 1e6
+        per_status = retained_memory(cls) / FLEET_SIZE
+        print(f"{label:10} {per_call:10.2f} {per_status:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
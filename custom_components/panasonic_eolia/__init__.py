@@ -2,31 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.ssl import get_default_context
 
 from custom_components.panasonic_eolia.climate import PanasonicEoliaClimate
 from custom_components.panasonic_eolia.eolia.device import Appliance
+from custom_components.panasonic_eolia.eolia.exceptions import PanasonicEoliaException
 from custom_components.panasonic_eolia.eolia.responses import DeviceStatus
 from custom_components.panasonic_eolia.eolia_data import (
+    EoliaAccountDataCoordinator,
     EoliaApplianceData,
     EoliaData,
     PanasonicEoliaConfigEntry,
 )
 
 from .const import DOMAIN
-from .eolia.auth import PanasonicEolia
+from .capabilities import async_get_capability_cache
+from .eolia.auth import DEFAULT_MAX_CONCURRENT_REQUESTS, PanasonicEolia
+from .eolia.transport import HAS_HTTP2, create_api_adapter
+from .inventory import EoliaInventory
+from .storage import EoliaSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
@@ -56,7 +64,9 @@ async def async_setup_entry(
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {}
 
-    session = get_async_client(hass)
+    # Token refreshes and userinfo share Home Assistant's aiohttp session and
+    # pool, the token based client needs no cookie jar of its own
+    session = async_get_clientsession(hass)
     _LOGGER.info("Got aiohttp session from Home Assistant")
 
     def _store_tokens(access_token: str, refresh_token: str) -> None:
@@ -75,25 +85,113 @@ async def async_setup_entry(
             },
         )
 
-    if access_token != "" and refresh_token != "":
-        auth = PanasonicEolia(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            session=session,
-            token_update_callback=_store_tokens,
-        )
-    else:
+    if access_token == "" or refresh_token == "":
         raise ValueError(f"Invalid auth method: {auth_method}")
 
-    userinfo = await auth.get_userinfo()
-    if userinfo is None:
-        raise ConfigEntryAuthFailed("Authentication failed when fetching userinfo")
+    snapshot_store = EoliaSnapshotStore(hass, entry.entry_id)
+    stored_appliances, stored_statuses = await snapshot_store.async_load()
+
+    # The app API gets a pool of its own, sized to the poll fan-out of the
+    # fleet (when known) plus one connection for commands
+    fan_out = min(
+        len(stored_appliances) or DEFAULT_MAX_CONCURRENT_REQUESTS,
+        DEFAULT_MAX_CONCURRENT_REQUESTS,
+    )
+    pool_size = fan_out + 1
+    auth = PanasonicEolia(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        session=session,
+        token_update_callback=_store_tokens,
+        api_session=create_api_adapter(pool_size, verify=get_default_context()),
+    )
+    # Home Assistant only unloads entries that were set up, a failed setup
+    # has to release the client and its API pool itself
+    try:
+        await _async_setup_client(
+            hass,
+            entry,
+            auth,
+            snapshot_store,
+            stored_appliances,
+            stored_statuses,
+            pool_size,
+        )
+    except BaseException:
+        await auth.close()
+        raise
+
+    async def _async_close_client(_event: Event) -> None:
+        await auth.close()
 
-    devices = await auth.get_devices()
+    # The API pool is not one of Home Assistant's shared clients, close it when
+    # Home Assistant stops as well
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
+    return True
+
+
+async def _async_setup_client(
+    hass: HomeAssistant,
+    entry: PanasonicEoliaConfigEntry,
+    auth: PanasonicEolia,
+    snapshot_store: EoliaSnapshotStore,
+    stored_appliances: list[Appliance],
+    stored_statuses: dict[str, tuple[DeviceStatus, datetime | None]],
+    pool_size: int,
+) -> None:
+    """Load the appliances, start polling and set up the platforms."""
+    # Resolve and handshake with the API while the rest of the setup runs
+    entry.async_create_background_task(
+        hass,
+        auth.prewarm(1 if HAS_HTTP2 else pool_size),
+        f"{DOMAIN}_prewarm_{entry.entry_id}",
+    )
+
+    capabilities = await async_get_capability_cache(hass)
+
+    if stored_appliances:
+        # Come up on the persisted snapshot right away and reconcile with the
+        # cloud in the background
+        _LOGGER.debug(f"Restoring {len(stored_appliances)} appliances from storage")
+        devices = stored_appliances
+    else:
+        # Both only need the access token, an expired one is refreshed once for both
+        userinfo, devices = await asyncio.gather(
+            auth.get_userinfo(), auth.get_devices()
+        )
+        if userinfo is None:
+            raise ConfigEntryAuthFailed("Authentication failed when fetching userinfo")
+        if devices is None:
+            raise ConfigEntryNotReady("Failed to fetch the appliances of the account")
+        snapshot_store.async_set_appliances(devices)
+
+    # One coordinator polls every appliance of the account, platforms only
+    # listen to the per-appliance coordinators it feeds
+    coordinator = EoliaAccountDataCoordinator(
+        hass, auth, devices, snapshot_store=snapshot_store
+    )
+    entry.async_on_unload(
+        coordinator.async_add_listener(coordinator.async_push_snapshots)
+    )
+    if stored_appliances:
+        coordinator.async_restore(stored_statuses)
+    else:
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            capabilities.async_ensure(auth, _product_codes(devices)),
+        )
 
+    inventory = EoliaInventory(
+        hass, entry, auth, coordinator, devices, snapshot_store, capabilities
+    )
     data_class = EoliaData(
         eolia=auth,
         appliances=devices,
+        coordinator=coordinator,
+        inventory=inventory,
+        capabilities=capabilities,
     )
 
     entry.runtime_data = data_class
@@ -104,12 +202,55 @@ async def async_setup_entry(
     # entry.runtime_data = data_class
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
+
+    inventory.async_start()
+    if stored_appliances:
+        entry.async_create_background_task(
+            hass,
+            _async_reconcile(hass, entry),
+            f"{DOMAIN}_reconcile_{entry.entry_id}",
+        )
+
+
+async def _async_reconcile(
+    hass: HomeAssistant, entry: PanasonicEoliaConfigEntry
+) -> None:
+    """Check a restored entry against the cloud and refresh every appliance."""
+    data = entry.runtime_data
+
+    try:
+        userinfo, _ = await asyncio.gather(
+            data.eolia.get_userinfo(), data.inventory.async_refresh()
+        )
+        if userinfo is None:
+            _LOGGER.warning("Authentication failed when fetching userinfo")
+            entry.async_start_reauth(hass)
+            return
+
+        await asyncio.gather(
+            data.coordinator.async_refresh(),
+            data.capabilities.async_ensure(data.eolia, _product_codes(data.appliances)),
+        )
+    except (PanasonicEoliaException, asyncio.TimeoutError) as exc:
+        # The restored state stays, polling and the inventory retry on their own
+        _LOGGER.warning(f"Reconciling the restored appliances failed: {exc!r}")
+
+
+def _product_codes(appliances: list[Appliance]) -> set[str]:
+    return {
+        appliance.product_code for appliance in appliances if appliance.product_code
+    }
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await entry.runtime_data.eolia.close()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot of a deleted config entry."""
+    await EoliaSnapshotStore(hass, entry.entry_id).async_remove()
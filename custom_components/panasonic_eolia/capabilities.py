@@ -0,0 +1,130 @@
+"""Product capability cache for Panasonic Eolia models."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.panasonic_eolia.const import DOMAIN, PRODUCT_FUNCTIONS_TTL
+from custom_components.panasonic_eolia.eolia.auth import PanasonicEolia
+from custom_components.panasonic_eolia.eolia.responses import ProductFunctionsResponse
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.DEBUG)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.product_functions"
+DATA_CAPABILITIES = f"{DOMAIN}_capabilities"
+
+# Function ids gating optional features. They follow the names of the status
+# fields they control; a product that does not list one keeps the feature.
+FUNCTION_AIR_FLOW = "air_flow"
+FUNCTION_WIND_VOLUME = "wind_volume"
+FUNCTION_WIND_DIRECTION = "wind_direction"
+FUNCTION_INSIDE_TEMP = "inside_temp"
+
+
+class EoliaCapabilityCache:
+    """Product functions keyed by product_code.
+
+    Shared by every config entry, so each model is fetched once and reused by
+    all appliances of that model until PRODUCT_FUNCTIONS_TTL has passed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._products: dict[str, ProductFunctionsResponse] = {}
+        self._fetched_at: dict[str, datetime] = {}
+        self._inflight: dict[str, asyncio.Task[None]] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        for product_code, item in data.get("products", {}).items():
+            fetched_at = dt_util.parse_datetime(item.get("fetched_at") or "")
+            if fetched_at is None:
+                continue
+            self._products[product_code] = ProductFunctionsResponse.from_dict(
+                item.get("functions", {})
+            )
+            self._fetched_at[product_code] = fetched_at
+
+    def get(self, product_code: str | None) -> ProductFunctionsResponse | None:
+        if not product_code:
+            return None
+        return self._products.get(product_code)
+
+    def supports(self, product_code: str | None, function_id: str) -> bool:
+        """Whether the model offers a function, True while it is unknown."""
+        functions = self.get(product_code)
+        return functions is None or functions.supports(function_id)
+
+    def _is_fresh(self, product_code: str) -> bool:
+        fetched_at = self._fetched_at.get(product_code)
+        return (
+            fetched_at is not None
+            and dt_util.utcnow() - fetched_at < PRODUCT_FUNCTIONS_TTL
+        )
+
+    async def async_ensure(
+        self, eolia: PanasonicEolia, product_codes: set[str | None]
+    ) -> None:
+        """Fetch the models that are missing or expired, concurrently.
+
+        A model whose fetch fails keeps its previous (possibly expired) entry.
+        """
+        tasks = []
+        for product_code in product_codes:
+            if not product_code or self._is_fresh(product_code):
+                continue
+            if product_code not in self._inflight:
+                self._inflight[product_code] = asyncio.create_task(
+                    self._async_fetch(eolia, product_code)
+                )
+            tasks.append(self._inflight[product_code])
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_fetch(self, eolia: PanasonicEolia, product_code: str) -> None:
+        try:
+            functions = await eolia.get_product_functions(product_code)
+        except Exception as exc:
+            _LOGGER.warning(f"Failed to fetch functions of {product_code}: {exc}")
+            return
+        finally:
+            self._inflight.pop(product_code, None)
+
+        if functions is None:
+            return
+
+        _LOGGER.debug(f"Cached functions of product {product_code}")
+        self._products[product_code] = functions
+        self._fetched_at[product_code] = dt_util.utcnow()
+        self._store.async_delay_save(self._data_to_save, 10)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "products": {
+                product_code: {
+                    "functions": functions.to_dict(),
+                    "fetched_at": self._fetched_at[product_code].isoformat(),
+                }
+                for product_code, functions in self._products.items()
+            }
+        }
+
+
+@singleton(DATA_CAPABILITIES)
+async def async_get_capability_cache(hass: HomeAssistant) -> EoliaCapabilityCache:
+    """Return the capability cache shared by all entries, loading it once."""
+    cache = EoliaCapabilityCache(hass)
+    await cache.async_load()
+    return cache
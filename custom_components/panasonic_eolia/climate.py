@@ -14,13 +14,22 @@ from homeassistant.components.climate.const import (
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from custom_components.panasonic_eolia.capabilities import (
+    FUNCTION_AIR_FLOW,
+    FUNCTION_WIND_DIRECTION,
+    FUNCTION_WIND_VOLUME,
+    EoliaCapabilityCache,
+)
+from custom_components.panasonic_eolia.const import SIGNAL_APPLIANCES_ADDED
+from custom_components.panasonic_eolia.entity import EoliaStatusEntity
 from custom_components.panasonic_eolia.eolia.auth import PanasonicEolia
 from custom_components.panasonic_eolia.eolia.device import Appliance
 from custom_components.panasonic_eolia.eolia.exceptions import (
     DeviceLockedByAnotherControllerException,
+    PanasonicEoliaException,
 )
 from custom_components.panasonic_eolia.eolia.responses import (
     AirFlow,
@@ -63,6 +72,17 @@ FAN_MODE_TO_AIR_FLOW = {
     "Max": AirFlow.POWERFUL.value,
 }
 
+FAN_MODES = [
+    "Auto",
+    "Quiet",
+    "Low",
+    "Medium",
+    "Medium High",
+    "High",
+    "Very High",
+    "Max",
+]
+
 # Map swing modes to wind direction
 SWING_MODE_TO_WIND_DIRECTION = {
     "Auto": WindDirection.AUTO.value,
@@ -95,27 +115,45 @@ async def async_setup_entry(
         f"Climate async_setup_entry called, num devices: {len(entry.runtime_data.appliances)}"
     )
 
-    entities = []
-    for device in entry.runtime_data.appliances:
-        _LOGGER.info(f"discovered aircon {device.nickname}")
-        coordinator = EolliaApplianceDataCoordinator(
-            hass, entry.runtime_data.eolia, device
-        )
+    @callback
+    def _async_add_appliances(appliances: list[Appliance]) -> None:
+        entities = []
+        for device in appliances:
+            _LOGGER.info(f"discovered aircon {device.nickname}")
+            coordinator = entry.runtime_data.coordinator.appliance_coordinators.get(
+                device.appliance_id
+            )
+            if coordinator is None:
+                continue
+
+            # The account coordinator's first refresh already seeded the status
+            entity = PanasonicEoliaClimate(
+                coordinator=coordinator,
+                appliance=device,
+                eolia=entry.runtime_data.eolia,
+                capabilities=entry.runtime_data.capabilities,
+            )
+            entities.append(entity)
 
-        entity = PanasonicEoliaClimate(
-            coordinator=coordinator, appliance=device, eolia=entry.runtime_data.eolia
-        )
-        await entity.query_device_state()
-        entities.append(entity)
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    _async_add_appliances(entry.runtime_data.appliances)
+
+    # Appliances discovered later by the inventory
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_APPLIANCES_ADDED.format(entry.entry_id),
+            _async_add_appliances,
+        )
+    )
 
     # For now, create a dummy entity
     # Later this will use the coordinator from hass.data[DOMAIN][entry.entry_id]
     # async_add_entities([PanasonicEoliaClimate()])
 
 
-class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
+class PanasonicEoliaClimate(EoliaStatusEntity, ClimateEntity):
     """Representation of a Panasonic Eolia climate device."""
 
     _attr_has_entity_name = True
@@ -129,8 +167,19 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
     )
     _appliance: Appliance
     _eolia: PanasonicEolia
-    _last_device_status: DeviceStatus
+    _last_device_status: DeviceStatus | None
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _status_fields = frozenset(
+        {
+            "operation_mode",
+            "operation_status",
+            "inside_temp",
+            "temperature",
+            "wind_volume",
+            "wind_direction",
+            "air_flow",
+        }
+    )
 
     _coordinator: EolliaApplianceDataCoordinator
 
@@ -139,6 +188,7 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
         coordinator: EolliaApplianceDataCoordinator,
         appliance: Appliance,
         eolia: PanasonicEolia,
+        capabilities: EoliaCapabilityCache | None = None,
     ) -> None:
         """Initialize the climate device."""
         _LOGGER.debug(
@@ -155,66 +205,45 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
 
         self._coordinator = coordinator
 
+        # Only advertise what the model offers, unknown models get everything
+        def supports(function_id: str) -> bool:
+            return capabilities is None or capabilities.supports(
+                appliance.product_code, function_id
+            )
+
+        has_air_flow = supports(FUNCTION_AIR_FLOW)
+        has_wind_volume = supports(FUNCTION_WIND_VOLUME)
+        self._attr_fan_modes = [
+            fan_mode
+            for fan_mode in FAN_MODES
+            if (fan_mode in FAN_MODE_TO_AIR_FLOW and has_air_flow)
+            or (fan_mode in FAN_MODE_TO_WIND_VOLUME and has_wind_volume)
+        ]
+        features = ClimateEntityFeature.TARGET_TEMPERATURE
+        if self._attr_fan_modes:
+            features |= ClimateEntityFeature.FAN_MODE
+        if supports(FUNCTION_WIND_DIRECTION):
+            features |= ClimateEntityFeature.SWING_MODE
+        if has_air_flow:
+            features |= ClimateEntityFeature.PRESET_MODE
+        self._attr_supported_features = features
+
         # State variables
         # self._current_temperature = 25.0
         # self._target_temperature = 22.0
         # self._hvac_mode = HVACMode.OFF
         # self._is_on = False
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            f"handle_coordinator_update called with appliance: {self._appliance.nickname}"
-        )
-        status = self.coordinator.data.status
-        # appliance =self.coordinator.data["appliance"]
-
-        self._last_device_status = status
-
-        # self._attr_is_on = self.coordinator.data[self.idx]["state"]
-        self.async_write_ha_state()
-
     @property
     def should_poll(self) -> bool:
         """Return True if entity should be polled."""
         return False
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self.query_device_state()
-
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        await self.query_device_state()
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._last_device_status is not None
-        )
-
-    async def query_device_state(self):
-        """Query the device state."""
-        if self._appliance.appliance_id is not None:
-            try:
-                status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-                _LOGGER.debug(f"Device status: {status}")
-                _LOGGER.debug("Device status keys and values:")
-                for key, value in vars(status).items():
-                    _LOGGER.debug(f"  {key}: {value}")
-                self._last_device_status = status
-            except Exception as e:
-                _LOGGER.error(f"Failed to query device state: {e}")
-
     @property
-    def hvac_mode(self) -> HVACMode:
+    def hvac_mode(self) -> HVACMode | None:
         """Return current HVAC mode."""
+        if self._last_device_status is None:
+            return None
         _LOGGER.debug(
             f"[{self._appliance.nickname}] hvac_mode() == {self._last_device_status.operation_mode}"
         )
@@ -252,31 +281,28 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
         _LOGGER.debug(f"[{self._appliance.nickname}] current_temperature()")
+        if self._last_device_status is None:
+            return None
         return self._last_device_status.inside_temp
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
+        if self._last_device_status is None:
+            return None
         return self._last_device_status.temperature
 
     @property
     def fan_modes(self) -> list[str]:
         """Return available fan modes."""
-        return [
-            "Auto",
-            "Quiet",
-            "Low",
-            "Medium",
-            "Medium High",
-            "High",
-            "Very High",
-            "Max",
-        ]
+        return self._attr_fan_modes
 
     @property
-    def fan_mode(self) -> str:
+    def fan_mode(self) -> str | None:
         """Return current fan mode."""
         _LOGGER.debug(f"[{self._appliance.nickname}] fan_mode()")
+        if self._last_device_status is None:
+            return None
         _LOGGER.debug(
             f"[{self._appliance.nickname}] current wind_volume {self._last_device_status.wind_volume}"
         )
@@ -318,9 +344,11 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
         ]
 
     @property
-    def swing_mode(self) -> str:
+    def swing_mode(self) -> str | None:
         """Return current swing mode."""
         _LOGGER.debug(f"[{self._appliance.nickname}] swing_modes()")
+        if self._last_device_status is None:
+            return None
         _LOGGER.debug(
             f"[{self._appliance.nickname}] current swing_mode {self._last_device_status.wind_direction}"
         )
@@ -346,7 +374,9 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
         return [PRESET_NONE, PRESET_SLEEP, PRESET_BOOST]
 
     @property
-    def preset_mode(self) -> str:
+    def preset_mode(self) -> str | None:
+        if self._last_device_status is None:
+            return None
         if self._last_device_status.air_flow == AirFlow.QUIET:
             return PRESET_SLEEP
         elif self._last_device_status.air_flow == AirFlow.POWERFUL:
@@ -360,7 +390,6 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
             _LOGGER.debug(f"Set temperature to {temperature}")
             try:
                 await self._coordinator._async_set_temperature(temperature)
-                await self._coordinator.async_request_refresh()
             except DeviceLockedByAnotherControllerException:
                 _LOGGER.error(
                     f"Cannot change {self._appliance.nickname} - it's being controlled by another device"
@@ -369,6 +398,10 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                     f"{self._appliance.nickname} is being controlled by another device. "
                     "Please wait 2 minutes before trying again."
                 )
+            except PanasonicEoliaException as exc:
+                raise HomeAssistantError(
+                    f"Could not change {self._appliance.nickname}: {exc}"
+                ) from exc
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
@@ -386,8 +419,6 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                 else:
                     _LOGGER.error(f"Unknown HVAC mode: {hvac_mode}")
                     return
-
-            await self._coordinator.async_request_refresh()
         except DeviceLockedByAnotherControllerException:
             _LOGGER.error(
                 f"Cannot change {self._appliance.nickname} - it's being controlled by another device"
@@ -396,6 +427,10 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                 f"{self._appliance.nickname} is being controlled by another device. "
                 "Please wait 2 minutes before trying again."
             )
+        except PanasonicEoliaException as exc:
+            raise HomeAssistantError(
+                f"Could not change {self._appliance.nickname}: {exc}"
+            ) from exc
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
@@ -417,8 +452,6 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
             else:
                 _LOGGER.error(f"Unknown fan mode: {fan_mode}")
                 return
-
-            await self._coordinator.async_request_refresh()
         except DeviceLockedByAnotherControllerException:
             _LOGGER.error(
                 f"Cannot change {self._appliance.nickname} - it's being controlled by another device"
@@ -427,6 +460,10 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                 f"{self._appliance.nickname} is being controlled by another device. "
                 "Please wait 2 minutes before trying again."
             )
+        except PanasonicEoliaException as exc:
+            raise HomeAssistantError(
+                f"Could not change {self._appliance.nickname}: {exc}"
+            ) from exc
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new swing mode."""
@@ -439,8 +476,6 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
             else:
                 _LOGGER.error(f"Unknown swing mode: {swing_mode}")
                 return
-
-            await self._coordinator.async_request_refresh()
         except DeviceLockedByAnotherControllerException:
             _LOGGER.error(
                 f"Cannot change {self._appliance.nickname} - it's being controlled by another device"
@@ -449,6 +484,10 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                 f"{self._appliance.nickname} is being controlled by another device. "
                 "Please wait 2 minutes before trying again."
             )
+        except PanasonicEoliaException as exc:
+            raise HomeAssistantError(
+                f"Could not change {self._appliance.nickname}: {exc}"
+            ) from exc
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
@@ -461,8 +500,6 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
             else:
                 _LOGGER.error(f"Unknown preset mode: {preset_mode}")
                 return
-
-            await self._coordinator.async_request_refresh()
         except DeviceLockedByAnotherControllerException:
             _LOGGER.error(
                 f"Cannot change {self._appliance.nickname} - it's being controlled by another device"
@@ -471,3 +508,7 @@ class PanasonicEoliaClimate(CoordinatorEntity, ClimateEntity):
                 f"{self._appliance.nickname} is being controlled by another device. "
                 "Please wait 2 minutes before trying again."
             )
+        except PanasonicEoliaException as exc:
+            raise HomeAssistantError(
+                f"Could not change {self._appliance.nickname}: {exc}"
+            ) from exc
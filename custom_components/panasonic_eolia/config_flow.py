@@ -88,6 +88,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            eolia = None
             try:
                 session = get_async_client(self.hass)
                 eolia = PanasonicEolia(
@@ -146,6 +147,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Error during authentication")
                 errors["base"] = "unknown"
+            finally:
+                # Only the tokens are kept, stop the client's background refresh
+                if eolia is not None:
+                    await eolia.close()
 
         return self.async_show_form(
             step_id=step_id,
@@ -182,6 +187,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            eolia = None
             try:
                 session = get_async_client(self.hass)
                 eolia = PanasonicEolia(
@@ -244,6 +250,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Error during token authentication")
                 errors["base"] = "unknown"
+            finally:
+                # Only the tokens are kept, stop the client's background refresh
+                if eolia is not None:
+                    await eolia.close()
 
         return self.async_show_form(
             step_id=step_id,
@@ -1,3 +1,45 @@
 """Constants for the Panasonic Eolia integration."""
 
+from datetime import timedelta
+
 DOMAIN = "panasonic_eolia"
+
+# Poll interval bounds: busy appliances are polled at DEFAULT_SCAN_INTERVAL,
+# idle ones back off up to DEFAULT_MAX_SCAN_INTERVAL
+DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
+DEFAULT_MAX_SCAN_INTERVAL = timedelta(minutes=5)
+
+# Appliances stay on the fast interval for this long after a command
+COMMAND_FAST_POLL_WINDOW = timedelta(minutes=2)
+
+# Delay of the single verification poll that follows a burst of commands
+COMMAND_VERIFY_DELAY = timedelta(seconds=10)
+
+# Commands queued within this window are merged into a single PUT
+COMMAND_COALESCE_WINDOW = timedelta(milliseconds=500)
+
+# How often the appliance list of an account is checked for added or
+# removed units
+INVENTORY_REFRESH_INTERVAL = timedelta(hours=1)
+
+# Dispatched with the list of new appliances, formatted with the entry id
+SIGNAL_APPLIANCES_ADDED = f"{DOMAIN}_appliances_added_{{}}"
+
+# Product functions rarely change, they are re-fetched per model after this
+PRODUCT_FUNCTIONS_TTL = timedelta(days=30)
+
+# Sensor values are only published when they moved by at least the deadband,
+# at most once per minimum interval, and at the latest after the max silence
+SENSOR_TEMPERATURE_DEADBAND = 0.5
+SENSOR_MIN_PUBLISH_INTERVAL = timedelta(minutes=1)
+SENSOR_MAX_SILENCE = timedelta(minutes=30)
+
+# A failed poll keeps serving the last good status until it is older than
+# this, then the entities go unavailable. Well above the slow poll interval,
+# idle appliances are only refreshed that often.
+DEFAULT_STALE_AFTER = timedelta(minutes=15)
+
+# A poll cycle gives up on appliances that have not answered within this
+# budget, they keep their state and are retried on their next slot. Below the
+# fast poll interval, so one offline unit cannot delay the next cycle.
+DEFAULT_REFRESH_BUDGET = timedelta(seconds=10)
@@ -0,0 +1,71 @@
+"""Base entity of the Panasonic Eolia integration."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.panasonic_eolia.eolia.responses import DeviceStatus
+from custom_components.panasonic_eolia.eolia_data import (
+    EolliaApplianceDataCoordinator,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.DEBUG)
+
+
+class EoliaStatusEntity(CoordinatorEntity[EolliaApplianceDataCoordinator]):
+    """Entity built from the status of one appliance.
+
+    Most polls return the same status again. The state is only written when
+    one of the status fields the entity is built from changed, or when its
+    availability flipped, so identical states never reach the recorder.
+    """
+
+    # DeviceStatus fields the state and attributes of the entity derive from
+    _status_fields: frozenset[str] = frozenset()
+
+    _last_device_status: DeviceStatus | None
+    # availability at the last state write, None before the first one
+    _last_available: bool | None
+
+    def __init__(self, coordinator: EolliaApplianceDataCoordinator) -> None:
+        super().__init__(coordinator=coordinator)
+        self._last_device_status = coordinator.data.status if coordinator.data else None
+        self._last_available = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # the state is written once when the entity is added
+        self._last_available = self.available
+
+    @property
+    def available(self) -> bool:
+        """Available while the coordinator serves a status, even a stale one."""
+        return super().available and self._last_device_status is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if a field of this entity or its availability changed."""
+        previous = self._last_device_status
+        if self.coordinator.data:
+            self._last_device_status = self.coordinator.data.status
+
+        changed = (
+            self._last_device_status.diff(previous, self._status_fields)
+            if self._last_device_status is not None
+            else set()
+        )
+        available = self.available
+        if not self._should_write_state(changed) and available == self._last_available:
+            return
+
+        _LOGGER.debug(f"[{self.entity_id}] changed: {sorted(changed)}")
+        self._last_available = available
+        self.async_write_ha_state()
+
+    def _should_write_state(self, changed: set[str]) -> bool:
+        """Whether the fields that changed since the last update need a write."""
+        return bool(changed)
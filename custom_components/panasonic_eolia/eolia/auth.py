@@ -6,23 +6,49 @@ This script performs the complete OAuth flow to authenticate with the Panasonic
 and obtain an access token that can be used to call the devices endpoint.
 """
 
+import asyncio
 import base64
 import hashlib
+import json
 import logging
 import re
 import secrets
+import time
 import urllib.parse
-from datetime import datetime
-from typing import Callable, Dict, List, Optional
-
-import httpx
-
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cache import (
+    ENDPOINT_DEVICE_STATUS,
+    ENDPOINT_DEVICES,
+    ENDPOINT_PRODUCT_FUNCTIONS,
+    ENDPOINT_USERINFO,
+    MISSING,
+    TTLCache,
+)
 from .device import Appliance
-from .exceptions import DeviceLockedByAnotherControllerException
+from .exceptions import (
+    DeviceLockedByAnotherControllerException,
+    DeviceStatusUnavailableException,
+    RateLimitedException,
+    TransportException,
+)
+from .http_adapter import HTTPAdapter, HTTPResponse, create_adapter
+from .operation_tokens import OperationTokenManager
+from .rate_limit import (
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RateLimiter,
+    parse_retry_after,
+)
+from .request_builder import EOLIA_API_BASE_URL, EoliaRequestBuilder
 from .requests import UpdateDeviceRequest
+from .resilience import CircuitBreakers, RetryPolicy, is_server_error
 from .responses import (
     DevicesResponse,
     DeviceStatus,
+    DeviceStatusResult,
     ProductFunctionsResponse,
 )
 
@@ -35,6 +61,41 @@ AUTH0_CLIENT_IOS = (
     "eyJ2ZXJzaW9uIjoiMS4zOS4xIiwiZW52Ijp7InN3aWZ0IjoiNS54IiwiaU9TIjoiMjYuMiJ9LCJuYW1lIjoiQXV0aDAuc3dpZnQifQ"
 )
 
+# Upper bound of concurrent status requests during a fleet refresh
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Seconds before access token expiry at which it is refreshed in the background
+DEFAULT_TOKEN_REFRESH_MARGIN = 300
+
+# Background refreshes are never armed sooner than this, so short lived tokens
+# cannot make every refresh schedule the next one right away
+MIN_TOKEN_REFRESH_DELAY = 30.0
+
+# Commands throttled with a Retry-After up to this many seconds wait and retry
+MAX_COMMAND_RETRY_AFTER = 10.0
+
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+PREWARM_TIMEOUT = 10.0
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 18_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.6 Mobile/15E148 Safari/604.1"
+
+
+def _decode_jwt_claim(token: Optional[str], claim: str) -> Optional[float]:
+    """Return a numeric claim of a JWT, None if it has none"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))[claim])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _decode_jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """Return the exp claim of a JWT as unix timestamp, None if it has none"""
+    return _decode_jwt_claim(token, "exp")
+
+
 class PanasonicEolia:
     def __init__(
         self,
@@ -42,19 +103,30 @@ class PanasonicEolia:
         password=None,
         access_token=None,
         refresh_token=None,
-        session: Optional[httpx.AsyncClient] = None,
+        session: Optional[Any] = None,
         token_update_callback: Optional[Callable[[str, str], None]] = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        token_refresh_margin: float = DEFAULT_TOKEN_REFRESH_MARGIN,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        request_burst: int = DEFAULT_REQUEST_BURST,
+        api_session: Optional[Any] = None,
+        cache: Optional[TTLCache] = None,
     ):
-        if session:
-            self.session = session
-        else:
+        if session is None:
             _LOGGER.warning("no session provided, using default one")
-            # Create client with cookie support and longer timeout
-            self.session = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                follow_redirects=False,  # We handle redirects manually
-            )
+        # httpx or aiohttp session, or a ready HTTPAdapter. Redirects are never
+        # followed implicitly, the login flow handles them itself
+        self.http = create_adapter(
+            session,
+            headers={"User-Agent": BROWSER_USER_AGENT},
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+        )
+        # Optional separate session for the app API, e.g. a dedicated pool
+        self.api_http = (
+            create_adapter(api_session, timeout=DEFAULT_REQUEST_TIMEOUT)
+            if api_session is not None
+            else None
+        )
 
         # Check that we have either username/password OR access_token/refresh_token
         if username and password:
@@ -73,12 +145,31 @@ class PanasonicEolia:
             )
 
         self._token_update_callback = token_update_callback
-
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.6 Mobile/15E148 Safari/604.1"
-            }
-        )
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.operation_tokens = OperationTokenManager()
+        self._request_builder = EoliaRequestBuilder()
+        self.rate_limiter = RateLimiter(requests_per_second, request_burst)
+        self.retry_policy = RetryPolicy()
+        self.circuit_breakers = CircuitBreakers()
+        # Token refresh currently in flight, shared by all concurrent callers
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Status reads in flight per device, shared the same way
+        self._status_tasks: Dict[str, asyncio.Task] = {}
+        # Callers still waiting for each of those reads
+        self._status_waiters: Dict[asyncio.Task, int] = {}
+        # Bumped whenever a PUT finishes, status reads that started before it
+        # must not overwrite its state in the cache and the token manager
+        self._status_generations: Dict[str, int] = {}
+        # Read-through cache of successful responses
+        self.cache = cache if cache is not None else TTLCache()
+
+        # Proactive refresh, armed from the exp claim of the access token
+        self.token_refresh_margin = token_refresh_margin
+        self._token_refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._background_refresh_task: Optional[asyncio.Task] = None
+        self._scheduled_token: Optional[str] = None
+        # exp claim of the token the last refresh was armed for
+        self._scheduled_expiry: Optional[float] = None
 
         # OAuth client details
         self.client_id = "JpNCoLeXs4rPMhWmnOjbOxat7MWTZEgr"
@@ -118,27 +209,211 @@ class PanasonicEolia:
         except Exception as exc:
             _LOGGER.warning("Failed to persist refreshed tokens: %s", exc)
 
+    def _schedule_token_refresh(self) -> None:
+        """Arm a background refresh token_refresh_margin seconds before expiry"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Constructed outside of a running loop, armed on the first request
+            return
+
+        if self._token_refresh_handle:
+            self._token_refresh_handle.cancel()
+            self._token_refresh_handle = None
+        self._scheduled_token = self.access_token
+
+        expires_at = _decode_jwt_expiry(self.access_token)
+        if expires_at is None or not self.refresh_token:
+            return
+        if self._scheduled_expiry is not None and expires_at <= self._scheduled_expiry:
+            # Refreshing again would not get us a longer lived token
+            _LOGGER.warning(
+                "Refreshed access token does not expire later, not scheduling "
+                "another background refresh"
+            )
+            return
+        self._scheduled_expiry = expires_at
+
+        # Tokens living no longer than the margin are refreshed halfway through
+        now = time.time()
+        issued_at = _decode_jwt_claim(self.access_token, "iat")
+        if issued_at is not None:
+            lifetime = expires_at - issued_at
+        elif getattr(self, "expires_in", None):
+            lifetime = float(self.expires_in)
+        else:
+            lifetime = expires_at - now
+        margin = min(self.token_refresh_margin, lifetime / 2)
+        delay = max(MIN_TOKEN_REFRESH_DELAY, expires_at - now - margin)
+        _LOGGER.debug(f"Scheduling background token refresh in {delay:.0f} seconds")
+        self._token_refresh_handle = loop.call_later(
+            delay, self._start_background_refresh
+        )
+
+    def _start_background_refresh(self) -> None:
+        self._token_refresh_handle = None
+        self._background_refresh_task = asyncio.get_running_loop().create_task(
+            self._background_refresh()
+        )
+
+    async def _background_refresh(self) -> None:
+        try:
+            if not await self.refresh_access_token():
+                _LOGGER.warning(
+                    "Background token refresh failed, retrying on the next request"
+                )
+        except Exception as exc:
+            _LOGGER.warning(f"Background token refresh failed: {exc}")
+
+    async def close(self) -> None:
+        """Cancel background work and close the session if we created it"""
+        if self._token_refresh_handle:
+            self._token_refresh_handle.cancel()
+            self._token_refresh_handle = None
+        if self._background_refresh_task and not self._background_refresh_task.done():
+            self._background_refresh_task.cancel()
+        for task in self._status_tasks.values():
+            task.cancel()
+        self._status_tasks.clear()
+        self._scheduled_token = None
+        self._scheduled_expiry = None
+        await self.http.close()
+        if self.api_http:
+            await self.api_http.close()
+
+    def _adapter_for(self, url: str) -> HTTPAdapter:
+        if self.api_http and url.startswith(EOLIA_API_BASE_URL):
+            return self.api_http
+        return self.http
+
+    async def prewarm(self, connections: int = 1) -> None:
+        """Resolve and connect to the app API ahead of the first poll.
+
+        Opens up to connections pooled connections (DNS, TCP and TLS) so the
+        first cycle does not pay for the handshakes. The answer is ignored.
+        """
+        adapter = self._adapter_for(EOLIA_API_BASE_URL)
+        results = await asyncio.gather(
+            *(
+                adapter.request("HEAD", EOLIA_API_BASE_URL, timeout=PREWARM_TIMEOUT)
+                for _ in range(max(1, connections))
+            ),
+            return_exceptions=True,
+        )
+        warmed = sum(1 for result in results if isinstance(result, HTTPResponse))
+        _LOGGER.debug(f"Pre-warmed {warmed} of {len(results)} API connections")
+
     async def _request(
         self,
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         retry_on_unauthorized: bool = True,
+        priority: int = PRIORITY_POLL,
         **kwargs,
-    ) -> httpx.Response:
-        response = await self.session.request(method, url, headers=headers, **kwargs)
+    ) -> HTTPResponse:
+        if self._scheduled_token != self.access_token:
+            self._schedule_token_refresh()
+
+        response = await self._send(method, url, headers, priority, **kwargs)
         if retry_on_unauthorized and response.status_code in (401, 403):
-            _LOGGER.info("Request unauthorized, attempting token refresh")
-            refreshed = await self.refresh_access_token()
+            sent_authorization = (headers or {}).get("Authorization")
+            if (
+                sent_authorization
+                and self.access_token
+                and sent_authorization != f"Bearer {self.access_token}"
+            ):
+                # The token was already refreshed while this request was in flight
+                _LOGGER.debug("Request used a stale token, retrying with the new one")
+                refreshed = True
+            else:
+                _LOGGER.info("Request unauthorized, attempting token refresh")
+                refreshed = await self.refresh_access_token()
             if refreshed:
                 refreshed_headers = dict(headers or {})
                 if self.access_token:
                     refreshed_headers["Authorization"] = f"Bearer {self.access_token}"
-                response = await self.session.request(
-                    method, url, headers=refreshed_headers, **kwargs
+                response = await self._send(
+                    method, url, refreshed_headers, priority, **kwargs
                 )
         return response
 
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        priority: int,
+        **kwargs,
+    ) -> HTTPResponse:
+        """Send a request guarded by the breaker of its host.
+
+        Idempotent requests failing with a transport error or a 5xx are retried
+        with backoff; the last response or error is handed to the caller.
+        """
+        breaker = self.circuit_breakers.breaker(url)
+        attempts = self.retry_policy.attempts_for(method)
+        for attempt in range(1, attempts + 1):
+            breaker.before_request()
+            try:
+                response = await self._send_once(
+                    method, url, headers, priority, **kwargs
+                )
+            except (asyncio.CancelledError, RateLimitedException):
+                # no verdict on the health of the host
+                breaker.release()
+                raise
+            except TransportException as exc:
+                breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                _LOGGER.debug(f"{method} {url} failed: {exc!r}, retrying")
+            else:
+                if not is_server_error(response.status_code):
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt == attempts:
+                    return response
+                _LOGGER.debug(
+                    f"{method} {url} answered {response.status_code}, retrying"
+                )
+            await asyncio.sleep(self.retry_policy.delay(attempt))
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        priority: int,
+        **kwargs,
+    ) -> HTTPResponse:
+        """Send a request within the budget of its host, backing off on 429
+
+        Commands are not held back for more than MAX_COMMAND_RETRY_AFTER, they
+        fail with RateLimitedException instead.
+        """
+        max_pause = MAX_COMMAND_RETRY_AFTER if priority == PRIORITY_COMMAND else None
+        await self.rate_limiter.acquire(url, priority, max_pause)
+        adapter = self._adapter_for(url)
+        response = await adapter.request(method, url, headers=headers, **kwargs)
+        if response.status_code != 429:
+            return response
+
+        retry_after = self.rate_limiter.pause(
+            url, parse_retry_after(response.headers.get("Retry-After"))
+        )
+        _LOGGER.warning(f"Rate limited by {url}, backing off for {retry_after:.0f}s")
+        if priority != PRIORITY_COMMAND:
+            # Polls simply fail, the next cycle tries again after the pause
+            return response
+        if retry_after > MAX_COMMAND_RETRY_AFTER:
+            raise RateLimitedException(urllib.parse.urlsplit(url).netloc, retry_after)
+
+        # The user is waiting for a command, retry it once the pause is over
+        await self.rate_limiter.acquire(url, priority)
+        return await adapter.request(method, url, headers=headers, **kwargs)
+
     async def step1_authorize(self):
         """Step 1: Initial authorization request"""
         _LOGGER.debug("Step 1: Initial authorization request...")
@@ -155,7 +430,8 @@ class PanasonicEolia:
             "auth0Client": "eyJ2ZXJzaW9uIjoiMS4zOS4xIiwibmFtZSI6IkF1dGgwLnN3aWZ0IiwiZW52Ijp7InZpZXciOiJhc3dhcyIsImlPUyI6IjE4LjYiLCJzd2lmdCI6IjUueCJ9fQ",
         }
 
-        response = await self.session.get(
+        response = await self.http.request(
+            "GET",
             "https://auth.digital.panasonic.com/authorize",
             params=params,
             follow_redirects=False,
@@ -185,7 +461,8 @@ class PanasonicEolia:
         _LOGGER.debug("Step 2: Getting login page...")
 
         # Follow the redirect to login page
-        response = await self.session.get(
+        response = await self.http.request(
+            "GET",
             "https://auth.digital.panasonic.com/login",
             params={
                 "state": self.auth_state,
@@ -242,7 +519,8 @@ class PanasonicEolia:
         """Step 3: Get challenge"""
         _LOGGER.debug("Step 3: Getting challenge...")
 
-        response = await self.session.post(
+        response = await self.http.request(
+            "POST",
             "https://auth.digital.panasonic.com/usernamepassword/challenge",
             headers={
                 "Content-Type": "application/json",
@@ -281,7 +559,8 @@ class PanasonicEolia:
             "connection": "CLUBPanasonic-Authentication",
         }
 
-        response = await self.session.post(
+        response = await self.http.request(
+            "POST",
             "https://auth.digital.panasonic.com/usernamepassword/login",
             headers={
                 "Content-Type": "application/json",
@@ -323,7 +602,8 @@ class PanasonicEolia:
 
         callback_data = {"wa": wa, "wresult": wresult, "wctx": wctx}
 
-        response = await self.session.post(
+        response = await self.http.request(
+            "POST",
             "https://auth.digital.panasonic.com/login/callback",
             headers={
                 "Content-Type": "application/x-www-form-urlencoded",
@@ -356,7 +636,8 @@ class PanasonicEolia:
         """Step 4c: Follow the authorize/resume redirect"""
         _LOGGER.debug("Step 4c: Following authorize/resume...")
 
-        response = await self.session.get(
+        response = await self.http.request(
+            "GET",
             "https://auth.digital.panasonic.com/authorize/resume",
             params={"state": resume_state},
             follow_redirects=False,
@@ -375,8 +656,8 @@ class PanasonicEolia:
                 if "cookie/attachContentToken" in location:
                     _LOGGER.debug("Got cookie attachment redirect, following it...")
                     # Follow the cookie attachment redirect
-                    cookie_response = await self.session.get(
-                        location, follow_redirects=False
+                    cookie_response = await self.http.request(
+                        "GET", location, follow_redirects=False
                     )
                     _LOGGER.debug(
                         f"Cookie attachment response status: {cookie_response.status_code}"
@@ -392,8 +673,8 @@ class PanasonicEolia:
                                 "Got redirect back to authorize, following it..."
                             )
                             # Follow the authorize redirect
-                            auth_response = await self.session.get(
-                                next_location, follow_redirects=False
+                            auth_response = await self.http.request(
+                                "GET", next_location, follow_redirects=False
                             )
                             _LOGGER.debug(
                                 f"Final authorize response status: {auth_response.status_code}"
@@ -472,7 +753,8 @@ class PanasonicEolia:
             "code_verifier": self.code_verifier,
         }
 
-        response = await self.session.post(
+        response = await self.http.request(
+            "POST",
             "https://auth.digital.panasonic.com/oauth/token",
             headers={
                 "Content-Type": "application/json",
@@ -495,6 +777,7 @@ class PanasonicEolia:
         _LOGGER.debug(
             f"Successfully obtained access token (expires in {self.expires_in} seconds)"
         )
+        self._schedule_token_refresh()
         return True
 
     async def authenticate(self):
@@ -515,6 +798,10 @@ class PanasonicEolia:
         if not self.access_token:
             raise ValueError("access_token is required to fetch userinfo")
 
+        cached = self.cache.get(ENDPOINT_USERINFO, self.access_token)
+        if cached is not MISSING:
+            return cached
+
         _LOGGER.debug("Fetching userinfo...")
 
         headers = {
@@ -528,7 +815,10 @@ class PanasonicEolia:
         )
 
         if response.status_code == 200:
-            return response.json()
+            userinfo = response.json()
+            # keyed by the token it was fetched with, after a refresh the new one
+            self.cache.set(ENDPOINT_USERINFO, self.access_token, userinfo)
+            return userinfo
 
         _LOGGER.debug(
             f"Failed to fetch userinfo: {response.status_code} - {response.text}"
@@ -536,7 +826,16 @@ class PanasonicEolia:
         return None
 
     async def refresh_access_token(self) -> bool:
-        """Refresh the access token using the refresh token."""
+        """Refresh the access token using the refresh token.
+
+        Concurrent callers await the refresh that is already in flight instead of
+        starting their own, so a rotated refresh token is only ever spent once.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_access_token())
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh_access_token(self) -> bool:
         if not self.refresh_token:
             raise ValueError("refresh_token is required to refresh access token")
 
@@ -548,7 +847,8 @@ class PanasonicEolia:
             "refresh_token": self.refresh_token,
         }
 
-        response = await self.session.post(
+        response = await self.http.request(
+            "POST",
             "https://auth.digital.panasonic.com/oauth/token",
             headers={
                 "Content-Type": "application/json",
@@ -572,35 +872,30 @@ class PanasonicEolia:
         )
         _LOGGER.debug("Successfully refreshed access token")
         self._persist_tokens()
+        self._schedule_token_refresh()
         return True
 
     async def get_devices(self) -> List[Appliance]:
         """Test the authentication by fetching devices"""
-        _LOGGER.debug("\nFetching devices...")
+        cached = self.cache.get(ENDPOINT_DEVICES)
+        if cached is not MISSING:
+            # callers keep and modify the list they get
+            return list(cached)
 
-        # Use Japan time (JST) for X-Eolia-Date
-        from datetime import timedelta, timezone
-
-        jst = timezone(timedelta(hours=9))
-        current_time = datetime.now(jst).strftime("%Y-%m-%dT%H:%M:%S")
+        _LOGGER.debug("\nFetching devices...")
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/Json; charset=UTF-8",  # Note: capital J as in the dump
-            "Accept": "application/json",
-            "X-Eolia-Date": current_time,
-            "User-Agent": "%E3%82%A8%E3%82%AA%E3%83%AA%E3%82%A2/81 CFNetwork/3826.600.31 Darwin/24.6.0",
-        }
+        headers = self._request_builder.headers(self.access_token)
 
         response = await self._request(
             "GET",
-            "https://app.rac.apws.panasonic.com/eolia/v6/devices",
+            f"{EOLIA_API_BASE_URL}/devices",
             headers=headers,
         )
 
         if response.status_code == 200:
-            devices = response.json()
-            return DevicesResponse.from_dict(devices).ac_list
+            devices = DevicesResponse.from_dict(response.json()).ac_list
+            self.cache.set(ENDPOINT_DEVICES, None, list(devices))
+            return devices
         else:
             _LOGGER.debug(
                 f"Failed to fetch devices: {response.status_code} - {response.text}"
@@ -609,88 +904,168 @@ class PanasonicEolia:
 
     async def get_product_functions(self, product_code: str):
         """Get function list for a specific product"""
-        _LOGGER.debug(f"\nFetching functions for product {product_code}...")
-
-        # Use Japan time (JST) for X-Eolia-Date
-        from datetime import timedelta, timezone
+        cached = self.cache.get(ENDPOINT_PRODUCT_FUNCTIONS, product_code)
+        if cached is not MISSING:
+            return cached
 
-        jst = timezone(timedelta(hours=9))
-        current_time = datetime.now(jst).strftime("%Y-%m-%dT%H:%M:%S")
+        _LOGGER.debug(f"\nFetching functions for product {product_code}...")
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/Json; charset=UTF-8",  # Note: capital J as in the dump
-            "Accept": "application/json",
-            "X-Eolia-Date": current_time,
-            "User-Agent": "%E3%82%A8%E3%82%AA%E3%83%AA%E3%82%A2/81 CFNetwork/3826.600.31 Darwin/24.6.0",
-        }
+        headers = self._request_builder.headers(self.access_token)
 
         response = await self._request(
             "GET",
-            f"https://app.rac.apws.panasonic.com/eolia/v6/products/{product_code}/functions",
+            f"{EOLIA_API_BASE_URL}/products/{product_code}/functions",
             headers=headers,
         )
 
         if response.status_code == 200:
-            return ProductFunctionsResponse.from_dict(response.json())
+            functions = ProductFunctionsResponse.from_dict(response.json())
+            self.cache.set(ENDPOINT_PRODUCT_FUNCTIONS, product_code, functions)
+            return functions
         else:
             _LOGGER.debug(
                 f"Failed to fetch product functions: {response.status_code} - {response.text}"
             )
             return None
 
-    async def get_device_status(self, device_id: str) -> DeviceStatus:
-        """Get status for a specific device"""
-        _LOGGER.debug(f"\nFetching status for device {device_id}...")
+    async def get_device_status(
+        self,
+        device_id: str,
+        priority: int = PRIORITY_POLL,
+        timeout: Optional[float] = None,
+    ) -> DeviceStatus:
+        """Get status for a specific device
+
+        Concurrent callers for the same device share a single request and the
+        DeviceStatus it returns, which they must not modify. The request keeps
+        running as long as any of them still waits for it. Statuses younger
+        than the cache TTL are served from memory.
+
+        With a timeout, asyncio.TimeoutError is raised once it passed. The
+        deadline only applies to this call, the shared request is cancelled
+        once every caller waiting for it gave up.
+        """
+        cached = self.cache.get(ENDPOINT_DEVICE_STATUS, device_id)
+        if cached is not MISSING:
+            return cached
+
+        task = self._status_tasks.get(device_id)
+        if task is None:
+            task = asyncio.create_task(self._get_device_status(device_id, priority))
+            self._status_tasks[device_id] = task
+            task.add_done_callback(lambda done: self._status_task_done(device_id, done))
+        else:
+            _LOGGER.debug(f"Joining the status request in flight for {device_id}")
+
+        self._status_waiters[task] = self._status_waiters.get(task, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            if not task.done():
+                self._status_waiters[task] -= 1
+                if not self._status_waiters[task]:
+                    _LOGGER.debug(
+                        f"Cancelling the abandoned status read of {device_id}"
+                    )
+                    task.cancel()
 
-        # Use Japan time (JST) for X-Eolia-Date
-        from datetime import timedelta, timezone
+    def _status_task_done(self, device_id: str, task: asyncio.Task) -> None:
+        if self._status_tasks.get(device_id) is task:
+            del self._status_tasks[device_id]
+        self._status_waiters.pop(task, None)
+        if not task.cancelled():
+            # retrieved here too, in case every caller was cancelled
+            task.exception()
 
-        jst = timezone(timedelta(hours=9))
-        current_time = datetime.now(jst).strftime("%Y-%m-%dT%H:%M:%S")
+    async def _get_device_status(self, device_id: str, priority: int) -> DeviceStatus:
+        _LOGGER.debug(f"\nFetching status for device {device_id}...")
+        generation = self._status_generations.get(device_id, 0)
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/Json; charset=UTF-8",  # Note: capital J as in the dump
-            "Accept": "application/json",
-            "X-Eolia-Date": current_time,
-            "User-Agent": "%E3%82%A8%E3%82%AA%E3%83%AA%E3%82%A2/81 CFNetwork/3826.600.31 Darwin/24.6.0",
-        }
+        headers = self._request_builder.headers(self.access_token)
 
         # URL encode the device_id
         encoded_device_id = urllib.parse.quote(device_id, safe="")
 
         response = await self._request(
             "GET",
-            f"https://app.rac.apws.panasonic.com/eolia/v6/devices/{encoded_device_id}/status",
+            f"{EOLIA_API_BASE_URL}/devices/{encoded_device_id}/status",
             headers=headers,
+            priority=priority,
         )
 
         if response.status_code == 200:
-            return DeviceStatus.from_dict(response.json())
+            status = DeviceStatus.from_dict(response.json())
+            if self._status_generations.get(device_id, 0) != generation:
+                _LOGGER.debug(
+                    f"Status of {device_id} predates a command, not caching it"
+                )
+                return status
+            self.operation_tokens.store(device_id, status.operation_token)
+            self.cache.set(ENDPOINT_DEVICE_STATUS, device_id, status)
+            return status
         else:
             _LOGGER.debug(
                 f"Failed to fetch device status: {response.status_code} - {response.text}"
             )
             return None
 
+    async def get_device_statuses(
+        self,
+        device_ids: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, DeviceStatusResult]:
+        """Get status for several devices concurrently
+
+        At most max_concurrency requests (defaults to max_concurrent_requests)
+        are in flight at once. A failing device does not fail the others, its
+        error is reported on its own DeviceStatusResult instead.
+
+        With a timeout the whole refresh is done within that many seconds:
+        every device waits at most for what is left of the budget when its
+        turn comes, devices that miss it fail with
+        DeviceStatusUnavailableException.
+        """
+        device_ids = list(dict.fromkeys(device_ids))
+        semaphore = asyncio.Semaphore(
+            max(1, max_concurrency or self.max_concurrent_requests)
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        async def _fetch(device_id: str) -> DeviceStatusResult:
+            async with semaphore:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError
+                    status = await self.get_device_status(device_id, timeout=remaining)
+                except asyncio.TimeoutError:
+                    _LOGGER.debug(f"Status of {device_id} missed the refresh deadline")
+                    return DeviceStatusResult(
+                        device_id,
+                        error=DeviceStatusUnavailableException(
+                            device_id,
+                            f"Status of {device_id} not received in time",
+                        ),
+                    )
+                except Exception as exc:
+                    _LOGGER.debug(f"Failed to fetch status for {device_id}: {exc}")
+                    return DeviceStatusResult(device_id, error=exc)
+
+            if status is None:
+                return DeviceStatusResult(
+                    device_id, error=DeviceStatusUnavailableException(device_id)
+                )
+            return DeviceStatusResult(device_id, status=status)
+
+        results = await asyncio.gather(*(_fetch(device_id) for device_id in device_ids))
+        return {result.appliance_id: result for result in results}
+
     async def update_device_status(self, device_id: str, status: UpdateDeviceRequest):
         """Update device status by sending PUT request"""
         _LOGGER.debug(f"\nUpdating status for device {device_id}...")
 
-        # Use Japan time (JST) for X-Eolia-Date
-        from datetime import timedelta, timezone
-
-        jst = timezone(timedelta(hours=9))
-        current_time = datetime.now(jst).strftime("%Y-%m-%dT%H:%M:%S")
-
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/Json; charset=UTF-8",  # Note: capital J as in the dump
-            "Accept": "application/json",
-            "X-Eolia-Date": current_time,
-            "User-Agent": "%E3%82%A8%E3%82%AA%E3%83%AA%E3%82%A2/81 CFNetwork/3826.600.31 Darwin/24.6.0",
-        }
+        headers = self._request_builder.headers(self.access_token)
 
         # URL encode the device_id
         encoded_device_id = urllib.parse.quote(device_id, safe="")
@@ -700,11 +1075,15 @@ class PanasonicEolia:
 
         # Ensure we have an operation_token - it should come from the previous status response
         if "operation_token" not in payload or payload["operation_token"] is None:
+            payload["operation_token"] = self.operation_tokens.get(device_id)
+
+        if payload["operation_token"] is None:
             _LOGGER.debug(
-                "Warning: No operation_token provided. You should use the token from the last status response."
+                "Warning: No fresh operation_token known, fetching the current status first."
+            )
+            current_status = await self.get_device_status(
+                device_id, priority=PRIORITY_COMMAND
             )
-            # For now, we'll need to fetch the current status first
-            current_status = await self.get_device_status(device_id)
             if current_status and current_status.operation_token:
                 payload["operation_token"] = current_status.operation_token
             else:
@@ -713,20 +1092,32 @@ class PanasonicEolia:
         _LOGGER.debug(f"Full payload: {payload}")
 
         _LOGGER.debug(
-            f"Full URL: https://app.rac.apws.panasonic.com/eolia/v6/devices/{encoded_device_id}/status"
+            f"Full URL: {EOLIA_API_BASE_URL}/devices/{encoded_device_id}/status"
         )
 
         response = await self._request(
             "PUT",
-            f"https://app.rac.apws.panasonic.com/eolia/v6/devices/{encoded_device_id}/status",
+            f"{EOLIA_API_BASE_URL}/devices/{encoded_device_id}/status",
             headers=headers,
             json=payload,
+            priority=PRIORITY_COMMAND,
+        )
+        # Whatever the outcome, the cached status may no longer be current
+        self._status_generations[device_id] = (
+            self._status_generations.get(device_id, 0) + 1
         )
+        self.cache.invalidate(ENDPOINT_DEVICE_STATUS, device_id)
 
         if response.status_code == 200:
             _LOGGER.debug("Successfully updated device status")
-            return DeviceStatus.from_dict(response.json())
+            updated_status = DeviceStatus.from_dict(response.json())
+            self.operation_tokens.store(device_id, updated_status.operation_token)
+            self.cache.set(ENDPOINT_DEVICE_STATUS, device_id, updated_status)
+            self.operation_tokens.mark_active(device_id)
+            return updated_status
         elif response.status_code == 409:
+            # Whatever token we sent is no longer accepted
+            self.operation_tokens.invalidate(device_id)
             # Check if it's the specific "device locked" error
             try:
                 error_data = response.json()
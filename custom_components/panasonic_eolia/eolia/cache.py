@@ -0,0 +1,103 @@
+"""Read-through cache for Panasonic Eolia API responses."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+ENDPOINT_USERINFO = "userinfo"
+ENDPOINT_DEVICES = "devices"
+ENDPOINT_PRODUCT_FUNCTIONS = "product_functions"
+ENDPOINT_DEVICE_STATUS = "device_status"
+
+# Seconds a response stays valid. Statuses must stay well below the poll
+# interval, or polls would only ever see cached data
+DEFAULT_TTLS = {
+    ENDPOINT_USERINFO: 300.0,
+    ENDPOINT_DEVICES: 60.0,
+    ENDPOINT_PRODUCT_FUNCTIONS: 3600.0,
+    ENDPOINT_DEVICE_STATUS: 5.0,
+}
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Returned by get when there is no valid entry, None is a valid value
+MISSING = object()
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class TTLCache:
+    """Size bounded LRU cache with a time to live per endpoint.
+
+    Entries are keyed by endpoint and an endpoint specific key (device id,
+    product code, ...). Endpoints without a TTL are never cached. Another
+    cache with the same interface can be passed to PanasonicEolia instead.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._stats: Dict[str, CacheStats] = {}
+
+    def _stats_for(self, endpoint: str) -> CacheStats:
+        if endpoint not in self._stats:
+            self._stats[endpoint] = CacheStats()
+        return self._stats[endpoint]
+
+    def get(self, endpoint: str, key: Hashable = None) -> Any:
+        """Return the cached value, or MISSING if there is none or it expired"""
+        entry = self._entries.get((endpoint, key))
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end((endpoint, key))
+            self._stats_for(endpoint).hits += 1
+            return entry[1]
+
+        if entry is not None:
+            del self._entries[(endpoint, key)]
+        self._stats_for(endpoint).misses += 1
+        return MISSING
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            return
+        self._entries[(endpoint, key)] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end((endpoint, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str, key: Hashable = None) -> None:
+        """Drop the entry of key, or every entry of the endpoint if key is None"""
+        if key is not None:
+            self._entries.pop((endpoint, key), None)
+            return
+        for cached in [cached for cached in self._entries if cached[0] == endpoint]:
+            del self._entries[cached]
+
+    def limit_ttl(self, endpoint: str, max_ttl: float) -> None:
+        """Keep the TTL of an endpoint at or below max_ttl"""
+        if endpoint in self.ttls:
+            self.ttls[endpoint] = min(self.ttls[endpoint], max_ttl)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit and miss counters per endpoint"""
+        return {endpoint: stats.to_dict() for endpoint, stats in self._stats.items()}
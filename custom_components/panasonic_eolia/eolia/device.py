@@ -1,4 +1,24 @@
 class Appliance:
+    __slots__ = (
+        "appliance_id",
+        "nickname",
+        "purchase_date",
+        "shop_category_id",
+        "shop_area_id",
+        "shop_name",
+        "inst_place_id",
+        "memo",
+        "appliance_type",
+        "product_code",
+        "product_name",
+        "hashed_guid",
+        "device_register_num",
+        "initialize_flg",
+        "repair_status",
+        "point_code",
+        "vpa_enable",
+    )
+
     def __init__(
         self,
         appliance_id=None,
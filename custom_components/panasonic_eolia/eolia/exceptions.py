@@ -16,3 +16,51 @@ class DeviceLockedByAnotherControllerException(PanasonicEoliaException):
     ):
         self.message = message
         super().__init__(self.message)
+
+
+class DeviceStatusUnavailableException(PanasonicEoliaException):
+    """Exception raised when the status of a device could not be fetched."""
+
+    def __init__(self, device_id: str, message=None):
+        self.device_id = device_id
+        self.message = message or f"Failed to fetch status for device {device_id}"
+        super().__init__(self.message)
+
+
+class CircuitOpenException(PanasonicEoliaException):
+    """Exception raised when requests to a failing host are paused."""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        self.message = f"Requests to {host} are paused for {retry_in:.0f} seconds"
+        super().__init__(self.message)
+
+
+class RateLimitedException(PanasonicEoliaException):
+    """Exception raised when a host asked us to back off for too long."""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        self.message = f"Rate limited by {host} for {retry_in:.0f} seconds"
+        super().__init__(self.message)
+
+
+class TransportException(PanasonicEoliaException):
+    """Exception raised when a request could not be sent or got no answer."""
+
+    def __init__(self, url: str, message=None):
+        self.url = url
+        self.message = message or f"Request to {url} failed"
+        super().__init__(self.message)
+
+
+class HTTPStatusException(PanasonicEoliaException):
+    """Exception raised for an unexpected HTTP status code."""
+
+    def __init__(self, url: str, status_code: int):
+        self.url = url
+        self.status_code = status_code
+        self.message = f"Request to {url} failed with status {status_code}"
+        super().__init__(self.message)
@@ -1,7 +1,9 @@
 """HTTP adapter to support both httpx and aiohttp clients."""
 
+import asyncio
+import json as jsonlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
 
 try:
     import aiohttp  # type: ignore
@@ -12,18 +14,71 @@ except ImportError:
 
 import httpx
 
+from .exceptions import HTTPStatusException, TransportException
+
+
+class HTTPResponse:
+    """Fully read response, independent of the HTTP client that fetched it."""
+
+    __slots__ = ("url", "status_code", "headers", "text")
+
+    def __init__(
+        self, url: str, status_code: int, headers: Mapping[str, str], text: str
+    ):
+        self.url = url
+        self.status_code = status_code
+        # case-insensitive, as provided by the client
+        self.headers = headers
+        self.text = text
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPStatusException(self.url, self.status_code)
+
 
 class HTTPAdapter(ABC):
     """Abstract base class for HTTP adapters."""
 
+    headers: Dict[str, str]
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Optional[Dict[str, Any]] = None,
+        follow_redirects: bool = False,
+        timeout: Optional[float] = None,
+    ) -> HTTPResponse:
+        """Make a request, data is sent form encoded.
+
+        Redirects are not followed unless asked for. Connection errors and
+        timeouts are raised as TransportException.
+        """
+        pass
+
     @abstractmethod
+    async def close(self) -> None:
+        """Close the session."""
+        pass
+
+    def _merge_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return {**self.headers, **(headers or {})}
+
     async def get(
         self, url: str, headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """Make a GET request."""
-        pass
+        response = await self.request("GET", url, headers=headers)
+        response.raise_for_status()
+        return response.json()
 
-    @abstractmethod
     async def post(
         self,
         url: str,
@@ -31,12 +86,20 @@ class HTTPAdapter(ABC):
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make a POST request with JSON data."""
-        pass
+        response = await self.request("POST", url, headers=headers, json=json_data)
+        response.raise_for_status()
+        return response.json()
 
-    @abstractmethod
-    async def close(self) -> None:
-        """Close the session."""
-        pass
+    async def put(
+        self,
+        url: str,
+        json_data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Make a PUT request with JSON data."""
+        response = await self.request("PUT", url, headers=headers, json=json_data)
+        response.raise_for_status()
+        return response.json()
 
 
 class HTTPXAdapter(HTTPAdapter):
@@ -47,38 +110,47 @@ class HTTPXAdapter(HTTPAdapter):
         session: Optional[httpx.AsyncClient] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: float = 15.0,
+        owns_session: Optional[bool] = None,
     ):
         self.session = session
         self.headers = headers or {}
         self.timeout = timeout
-        self._owns_session = session is None
+        # sessions we create ourselves are always ours to close
+        self._owns_session = session is None if owns_session is None else owns_session
 
     async def _ensure_session(self) -> httpx.AsyncClient:
         """Ensure we have a session."""
         if self.session is None:
-            self.session = httpx.AsyncClient(headers=self.headers, timeout=self.timeout)
+            self.session = httpx.AsyncClient(timeout=self.timeout)
         return self.session
 
-    async def get(
-        self, url: str, headers: Optional[Dict[str, str]] = None
-    ) -> Dict[str, Any]:
-        """Make a GET request."""
-        session = await self._ensure_session()
-        response = await session.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-
-    async def post(
+    async def request(
         self,
+        method: str,
         url: str,
-        json_data: Dict[str, Any],
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        """Make a POST request with JSON data."""
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Optional[Dict[str, Any]] = None,
+        follow_redirects: bool = False,
+        timeout: Optional[float] = None,
+    ) -> HTTPResponse:
+        """Make a request."""
         session = await self._ensure_session()
-        response = await session.post(url, json=json_data, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        try:
+            response = await session.request(
+                method,
+                url,
+                headers=self._merge_headers(headers),
+                params=params,
+                json=json,
+                data=data,
+                follow_redirects=follow_redirects,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        except httpx.TransportError as exc:
+            raise TransportException(url, f"{method} {url} failed: {exc!r}") from exc
+        return HTTPResponse(url, response.status_code, response.headers, response.text)
 
     async def close(self) -> None:
         """Close the session if we own it."""
@@ -96,32 +168,43 @@ if HAS_AIOHTTP:
             self,
             session: aiohttp.ClientSession,
             headers: Optional[Dict[str, str]] = None,
+            timeout: float = 15.0,
         ):
             self.session = session
             self.headers = headers or {}
+            self.timeout = timeout
 
-        async def get(
-            self, url: str, headers: Optional[Dict[str, str]] = None
-        ) -> Dict[str, Any]:
-            """Make a GET request."""
-            combined_headers = {**self.headers, **(headers or {})}
-            async with self.session.get(url, headers=combined_headers) as response:
-                response.raise_for_status()
-                return await response.json()
-
-        async def post(
+        async def request(
             self,
+            method: str,
             url: str,
-            json_data: Dict[str, Any],
             headers: Optional[Dict[str, str]] = None,
-        ) -> Dict[str, Any]:
-            """Make a POST request with JSON data."""
-            combined_headers = {**self.headers, **(headers or {})}
-            async with self.session.post(
-                url, json=json_data, headers=combined_headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+            params: Optional[Dict[str, Any]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, Any]] = None,
+            follow_redirects: bool = False,
+            timeout: Optional[float] = None,
+        ) -> HTTPResponse:
+            """Make a request."""
+            try:
+                async with self.session.request(
+                    method,
+                    url,
+                    headers=self._merge_headers(headers),
+                    params=params,
+                    json=json,
+                    data=data,
+                    allow_redirects=follow_redirects,
+                    timeout=aiohttp.ClientTimeout(
+                        total=self.timeout if timeout is None else timeout
+                    ),
+                ) as response:
+                    text = await response.text()
+                    return HTTPResponse(url, response.status, response.headers, text)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                raise TransportException(
+                    url, f"{method} {url} failed: {exc!r}"
+                ) from exc
 
         async def close(self) -> None:
             """aiohttp sessions are typically managed externally, so we don't close them."""
@@ -129,11 +212,16 @@ if HAS_AIOHTTP:
 
 
 def create_adapter(
-    session: Optional[Union[httpx.AsyncClient, "aiohttp.ClientSession"]] = None,
+    session: Optional[
+        Union[HTTPAdapter, httpx.AsyncClient, "aiohttp.ClientSession"]
+    ] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout: float = 15.0,
 ) -> HTTPAdapter:
     """Create an appropriate adapter based on the session type."""
+    if isinstance(session, HTTPAdapter):
+        return session
+
     if session is None:
         # Default to httpx for backward compatibility
         return HTTPXAdapter(headers=headers, timeout=timeout)
@@ -143,6 +231,6 @@ def create_adapter(
 
     if HAS_AIOHTTP and hasattr(session, "get") and hasattr(session, "post"):
         # Duck typing for aiohttp.ClientSession
-        return AIOHTTPAdapter(session=session, headers=headers)
+        return AIOHTTPAdapter(session=session, headers=headers, timeout=timeout)
 
     raise ValueError(f"Unsupported session type: {type(session)}")
@@ -0,0 +1,74 @@
+"""Operation token bookkeeping for Panasonic Eolia devices."""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Tokens are only accepted for about two minutes after they were issued
+DEFAULT_OPERATION_TOKEN_TTL = 120.0
+
+# Devices that received a command within this window count as active
+DEFAULT_ACTIVE_WINDOW = 600.0
+
+
+class OperationTokenManager:
+    """Keep the latest operation token of every device.
+
+    Tokens are taken from every status response, regular polls included, so
+    an update request can almost always go out without fetching the status
+    first.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_OPERATION_TOKEN_TTL,
+        active_window: float = DEFAULT_ACTIVE_WINDOW,
+    ):
+        self.ttl = ttl
+        self.active_window = active_window
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._last_command: Dict[str, float] = {}
+
+    def store(self, device_id: str, token: Optional[str]) -> None:
+        """Remember the token of a status response"""
+        if device_id and token:
+            self._tokens[device_id] = (token, time.monotonic())
+
+    def get(self, device_id: str) -> Optional[str]:
+        """Return the token of the device if it is still within its TTL"""
+        entry = self._tokens.get(device_id)
+        if entry is None:
+            return None
+
+        token, issued_at = entry
+        if time.monotonic() - issued_at >= self.ttl:
+            return None
+        return token
+
+    def invalidate(self, device_id: str) -> None:
+        self._tokens.pop(device_id, None)
+
+    def mark_active(self, device_id: str) -> None:
+        """Record that a command was sent to the device"""
+        self._last_command[device_id] = time.monotonic()
+
+    def is_active(self, device_id: str) -> bool:
+        last_command = self._last_command.get(device_id)
+        return (
+            last_command is not None
+            and time.monotonic() - last_command < self.active_window
+        )
+
+    def expires_in(self, device_id: str) -> float:
+        """Seconds until the token of the device expires, 0 if there is none"""
+        entry = self._tokens.get(device_id)
+        if entry is None:
+            return 0.0
+        return max(0.0, self.ttl - (time.monotonic() - entry[1]))
+
+    def devices_needing_refresh(self, margin: float = 30.0) -> List[str]:
+        """Active devices whose token is missing or expires within margin"""
+        return [
+            device_id
+            for device_id in self._last_command
+            if self.is_active(device_id) and self.expires_in(device_id) <= margin
+        ]
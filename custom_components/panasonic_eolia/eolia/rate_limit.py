@@ -0,0 +1,145 @@
+"""Client side request budget for the Panasonic APIs."""
+
+import asyncio
+import heapq
+import itertools
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+
+from .exceptions import RateLimitedException
+
+# Requests waiting for a token are served in priority order, lowest first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+# Sustained requests per second and burst size of every host
+DEFAULT_REQUESTS_PER_SECOND = 4.0
+DEFAULT_REQUEST_BURST = 10
+
+# Pause applied after a 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 30.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, in seconds or HTTP-date form"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Async token bucket whose waiters are served by priority.
+
+    Tokens refill at rate per second up to burst. While the server asked us
+    to back off (see pause) no token is handed out at all.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _delay(self, waiter: Tuple[int, int], now: float) -> Optional[float]:
+        """Seconds until waiter may take a token, None until the head changes"""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._waiters[0] != waiter:
+            return None
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        return 0.0
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> None:
+        waiter = (priority, next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiters, waiter)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._delay(waiter, now)
+                    if delay == 0:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        return
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    heapq.heapify(self._waiters)
+                # the next waiter in line may go now
+                self._condition.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+
+class RateLimiter:
+    """One token bucket per host"""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: float = DEFAULT_REQUEST_BURST,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urllib.parse.urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    async def acquire(
+        self,
+        url: str,
+        priority: int = PRIORITY_POLL,
+        max_pause: Optional[float] = None,
+    ) -> None:
+        """Wait for a token of the host of url
+
+        Raises RateLimitedException instead of waiting when the host is paused
+        for longer than max_pause.
+        """
+        bucket = self.bucket(url)
+        paused_for = bucket.paused_for()
+        if max_pause is not None and paused_for > max_pause:
+            raise RateLimitedException(urllib.parse.urlsplit(url).netloc, paused_for)
+        await bucket.acquire(priority)
+
+    def pause(self, url: str, retry_after: Optional[float]) -> float:
+        """Back off from the host of url after a 429, returns the pause"""
+        seconds = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        self.bucket(url).pause(seconds)
+        return seconds
@@ -0,0 +1,45 @@
+"""Request headers for the Eolia app API."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+EOLIA_API_BASE_URL = "https://app.rac.apws.panasonic.com/eolia/v6"
+
+# Use Japan time (JST) for X-Eolia-Date
+JST = timezone(timedelta(hours=9))
+
+EOLIA_STATIC_HEADERS = {
+    "Content-Type": "application/Json; charset=UTF-8",  # Note: capital J as in the dump
+    "Accept": "application/json",
+    "User-Agent": "%E3%82%A8%E3%82%AA%E3%83%AA%E3%82%A2/81 CFNetwork/3826.600.31 Darwin/24.6.0",
+}
+
+
+class EoliaRequestBuilder:
+    """Build the headers of app API requests.
+
+    The static headers are built once; only Authorization and X-Eolia-Date
+    change between requests, and the formatted date is reused for every
+    request within the same second.
+    """
+
+    def __init__(self):
+        self._date_second: Optional[int] = None
+        self._date_value = ""
+
+    def eolia_date(self) -> str:
+        second = int(time.time())
+        if second != self._date_second:
+            self._date_value = datetime.fromtimestamp(second, JST).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+            self._date_second = second
+        return self._date_value
+
+    def headers(self, access_token: Optional[str]) -> Dict[str, str]:
+        return {
+            **EOLIA_STATIC_HEADERS,
+            "Authorization": f"Bearer {access_token}",
+            "X-Eolia-Date": self.eolia_date(),
+        }
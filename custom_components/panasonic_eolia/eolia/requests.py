@@ -1,4 +1,18 @@
 class UpdateDeviceRequest:
+    __slots__ = (
+        "nanoex",
+        "operation_status",
+        "airquality",
+        "wind_volume",
+        "temperature",
+        "operation_mode",
+        "wind_direction",
+        "timer_value",
+        "operation_token",
+        "wind_direction_horizon",
+        "air_flow",
+    )
+
     def __init__(
         self,
         nanoex=None,
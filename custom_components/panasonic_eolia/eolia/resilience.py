@@ -0,0 +1,144 @@
+"""Retry policy and circuit breaker for the Panasonic APIs."""
+
+import logging
+import random
+import time
+import urllib.parse
+from typing import Dict, Optional
+
+from .exceptions import CircuitOpenException
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.DEBUG)
+
+# Only requests that can be repeated without side effects are retried
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.5
+DEFAULT_RETRY_MAX_DELAY = 5.0
+
+# Consecutive failures that open the breaker of a host, and how long it stays
+# open before a single probe request is let through
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0
+DEFAULT_MAX_RESET_TIMEOUT = 600.0
+
+
+def is_server_error(status_code: int) -> bool:
+    return 500 <= status_code < 600
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+    ):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def attempts_for(self, method: str) -> int:
+        return self.attempts if method.upper() in IDEMPOTENT_METHODS else 1
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt (starting at 1)"""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Stop calling a host after repeated failures.
+
+    After failure_threshold consecutive failures the breaker opens and every
+    request fails fast with CircuitOpenException. Once reset_timeout passed a
+    single probe is let through: success closes the breaker, failure opens it
+    again for twice as long (up to max_reset_timeout).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        max_reset_timeout: float = DEFAULT_MAX_RESET_TIMEOUT,
+    ):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max(reset_timeout, max_reset_timeout)
+        self._failures = 0
+        self._open_for = reset_timeout
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe may go out, 0 once it may"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._open_for - time.monotonic())
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenException unless a request may go out now"""
+        if self._opened_at is None:
+            return
+        retry_in = self.retry_in()
+        if self._probing or retry_in > 0:
+            raise CircuitOpenException(self.host, retry_in)
+        _LOGGER.debug(f"Circuit of {self.host} half open, sending a probe")
+        self._probing = True
+
+    def release(self) -> None:
+        """Give up a probe that ended without an outcome, e.g. cancelled"""
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info(f"Circuit of {self.host} closed again")
+        self._failures = 0
+        self._open_for = self.reset_timeout
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing:
+            self._open_for = min(self.max_reset_timeout, self._open_for * 2)
+        elif self._opened_at is None and self._failures < self.failure_threshold:
+            return
+
+        self._opened_at = time.monotonic()
+        self._probing = False
+        _LOGGER.warning(
+            f"Circuit of {self.host} open after {self._failures} failures, "
+            f"pausing requests for {self._open_for:.0f}s"
+        )
+
+
+class CircuitBreakers:
+    """One circuit breaker per host"""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = urllib.parse.urlsplit(url).netloc
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                host, self.failure_threshold, self.reset_timeout
+            )
+        return self._breakers[host]
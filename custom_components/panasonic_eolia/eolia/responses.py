@@ -67,6 +67,22 @@ class WindVolume(Enum):
     VERY_HIGH = 5
 
 
+# value -> member tables, so decoding a status does not scan every enum
+_ENUM_LOOKUP = {
+    enum_class: {member.value: member for member in enum_class}
+    for enum_class in (
+        OperationMode,
+        AirQualityName,
+        AIControl,
+        AirFlow,
+        WindShieldHit,
+        WindDirectionHorizon,
+        WindDirection,
+        WindVolume,
+    )
+}
+
+
 class DevicesResponse:
     def __init__(self, ac_list=None):
         self.ac_list = ac_list or []
@@ -114,6 +130,26 @@ class ProductFunctionsResponse:
             installation_type=data.get("installation_type"),
         )
 
+    def function_value(self, function_id):
+        """Return the value of a function, None if the product does not list it"""
+        for item in self.ac_function_list:
+            if item.get("function_id") == function_id:
+                return item.get("function_value")
+        return None
+
+    def supports(self, function_id, default: bool = True) -> bool:
+        """Whether the product offers a function
+
+        Functions the product does not list fall back to default, listed ones
+        are unsupported when their value is empty, zero or "off".
+        """
+        value = self.function_value(function_id)
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value.strip().lower() not in ("", "0", "off", "false", "none")
+        return bool(value)
+
     def to_dict(self):
         return {
             "ac_function_list": self.ac_function_list,
@@ -124,6 +160,30 @@ class ProductFunctionsResponse:
 
 
 class DeviceStatus:
+    __slots__ = (
+        "appliance_id",
+        "operation_status",
+        "operation_mode",
+        "temperature",
+        "inside_humidity",
+        "inside_temp",
+        "outside_temp",
+        "operation_priority",
+        "timer_value",
+        "device_errstatus",
+        "airquality",
+        "nanoex",
+        "aq_value",
+        "wind_volume",
+        "wind_direction",
+        "aq_name",
+        "ai_control",
+        "air_flow",
+        "wind_shield_hit",
+        "wind_direction_horizon",
+        "operation_token",
+    )
+
     def __init__(self, **kwargs):
         # Define expected attributes with proper types
         self.appliance_id: Optional[str] = kwargs.get("appliance_id")
@@ -133,7 +193,7 @@ class DeviceStatus:
 
         # Convert operation_mode string to enum if provided
         self.operation_mode: Optional[Union[OperationMode, str]] = cast(
-            Optional[Union[OperationMode, str]],
+            "Optional[Union[OperationMode, str]]",
             self._parse_enum(kwargs.get("operation_mode"), OperationMode),
         )
 
@@ -170,33 +230,33 @@ class DeviceStatus:
 
         # Parse enum fields
         self.wind_volume: Optional[Union[WindVolume, int]] = cast(
-            Optional[Union[WindVolume, int]],
+            "Optional[Union[WindVolume, int]]",
             self._parse_enum(kwargs.get("wind_volume"), WindVolume),
         )
 
         self.wind_direction: Optional[Union[WindDirection, str]] = cast(
-            Optional[Union[WindDirection, str]],
+            "Optional[Union[WindDirection, str]]",
             self._parse_enum(kwargs.get("wind_direction"), WindDirection),
         )
 
         self.aq_name: Optional[Union[AirQualityName, str]] = cast(
-            Optional[Union[AirQualityName, str]],
+            "Optional[Union[AirQualityName, str]]",
             self._parse_enum(kwargs.get("aq_name"), AirQualityName),
         )
         self.ai_control: Optional[Union[AIControl, str]] = cast(
-            Optional[Union[AIControl, str]],
+            "Optional[Union[AIControl, str]]",
             self._parse_enum(kwargs.get("ai_control"), AIControl),
         )
         self.air_flow: Optional[Union[AirFlow, str]] = cast(
-            Optional[Union[AirFlow, str]],
+            "Optional[Union[AirFlow, str]]",
             self._parse_enum(kwargs.get("air_flow"), AirFlow),
         )
         self.wind_shield_hit: Optional[Union[WindShieldHit, str]] = cast(
-            Optional[Union[WindShieldHit, str]],
+            "Optional[Union[WindShieldHit, str]]",
             self._parse_enum(kwargs.get("wind_shield_hit"), WindShieldHit),
         )
         self.wind_direction_horizon: Optional[Union[WindDirectionHorizon, str]] = cast(
-            Optional[Union[WindDirectionHorizon, str]],
+            "Optional[Union[WindDirectionHorizon, str]]",
             self._parse_enum(
                 kwargs.get("wind_direction_horizon"), WindDirectionHorizon
             ),
@@ -211,17 +271,24 @@ class DeviceStatus:
         if value is None:
             return None
 
-        for enum_member in enum_class:
-            if enum_member.value == value:
-                return enum_member
-
-        # If no match found, store the raw value
-        return value
+        try:
+            # If no match found, store the raw value
+            return _ENUM_LOOKUP[enum_class].get(value, value)
+        except TypeError:
+            # unhashable raw value
+            return value
 
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
+    def diff(self, other: Optional["DeviceStatus"], fields=None) -> set[str]:
+        """Names of the fields (all by default) whose value differs from other"""
+        fields = self.__slots__ if fields is None else fields
+        if other is None:
+            return set(fields)
+        return {name for name in fields if getattr(self, name) != getattr(other, name)}
+
     def to_dict(self):
         """Convert to dictionary, converting enums back to strings"""
         return {
@@ -229,8 +296,8 @@ class DeviceStatus:
             "operation_status": self.operation_status,
             "operation_mode": self._enum_to_value(self.operation_mode),
             "temperature": self.temperature,
-            "wind_volume": self.wind_volume,
-            "wind_direction": self.wind_direction,
+            "wind_volume": self._enum_to_value(self.wind_volume),
+            "wind_direction": self._enum_to_value(self.wind_direction),
             "inside_humidity": self.inside_humidity,
             "inside_temp": self.inside_temp,
             "outside_temp": self.outside_temp,
@@ -270,3 +337,23 @@ class DeviceStatus:
             operation_token=self.operation_token,
             wind_direction_horizon=self._enum_to_value(self.wind_direction_horizon),
         )
+
+
+class DeviceStatusResult:
+    """Outcome of fetching a single device during a fleet refresh."""
+
+    __slots__ = ("appliance_id", "status", "error")
+
+    def __init__(
+        self,
+        appliance_id: str,
+        status: Optional[DeviceStatus] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.appliance_id = appliance_id
+        self.status = status
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None
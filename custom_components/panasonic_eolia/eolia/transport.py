@@ -0,0 +1,45 @@
+"""Dedicated connection pool for the Eolia app API."""
+
+import importlib.util
+import ssl
+from typing import Union
+
+import httpx
+
+from .http_adapter import HTTPXAdapter
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Connections are kept open a little longer than the fast poll interval, so
+# consecutive poll cycles reuse them
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+DEFAULT_API_TIMEOUT = 30.0
+
+
+def create_api_adapter(
+    max_connections: int,
+    http2: bool = HAS_HTTP2,
+    verify: Union[bool, ssl.SSLContext] = True,
+    timeout: float = DEFAULT_API_TIMEOUT,
+) -> HTTPXAdapter:
+    """Adapter with its own httpx pool, closed together with the client.
+
+    The pool holds max_connections keep-alive connections. With HTTP/2 all
+    requests are multiplexed over a single connection instead. Pass an
+    ssl.SSLContext as verify when running inside an event loop, loading the
+    default certificates blocks.
+    """
+    client = httpx.AsyncClient(
+        http2=http2 and HAS_HTTP2,
+        verify=verify,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        ),
+        follow_redirects=False,
+    )
+    return HTTPXAdapter(session=client, timeout=timeout, owns_session=True)
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+
+from custom_components.panasonic_eolia.const import (
+    COMMAND_COALESCE_WINDOW,
+    COMMAND_VERIFY_DELAY,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_REFRESH_BUDGET,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_AFTER,
+)
 from custom_components.panasonic_eolia.eolia.auth import PanasonicEolia
+from custom_components.panasonic_eolia.eolia.cache import ENDPOINT_DEVICE_STATUS
 from custom_components.panasonic_eolia.eolia.device import Appliance
 from custom_components.panasonic_eolia.eolia.exceptions import (
+    CircuitOpenException,
     DeviceLockedByAnotherControllerException,
+    DeviceStatusUnavailableException,
+)
+from custom_components.panasonic_eolia.eolia.request_builder import (
+    EOLIA_API_BASE_URL,
 )
 from custom_components.panasonic_eolia.eolia.requests import UpdateDeviceRequest
 from custom_components.panasonic_eolia.eolia.responses import DeviceStatus
+from custom_components.panasonic_eolia.polling import AdaptivePollScheduler
+from custom_components.panasonic_eolia.storage import EoliaSnapshotStore
+
+if TYPE_CHECKING:
+    from custom_components.panasonic_eolia.capabilities import EoliaCapabilityCache
+    from custom_components.panasonic_eolia.inventory import EoliaInventory
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
@@ -26,118 +55,482 @@ type PanasonicEoliaConfigEntry = ConfigEntry[EoliaData]
 class EoliaData:
     eolia: PanasonicEolia
     appliances: list[Appliance]
+    coordinator: EoliaAccountDataCoordinator
+    inventory: EoliaInventory
+    capabilities: EoliaCapabilityCache
 
 
 @dataclass
 class EoliaApplianceData:
     appliance: Appliance
     status: DeviceStatus
+    # when the status was fetched from the cloud
+    updated_at: datetime | None = None
+
+    def age(self) -> timedelta | None:
+        """Time since the status was fetched, None if unknown."""
+        if self.updated_at is None:
+            return None
+        return dt_util.utcnow() - self.updated_at
+
+    def is_fresh(self, stale_after: timedelta) -> bool:
+        """Whether the status may still be served after a failed refresh."""
+        age = self.age()
+        return self.status is not None and age is not None and age <= stale_after
 
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
 
 
-class EolliaApplianceDataCoordinator(DataUpdateCoordinator[EoliaApplianceData]):
-    """Class to manage fetching data."""
+class EoliaAccountDataCoordinator(DataUpdateCoordinator[dict[str, EoliaApplianceData]]):
+    """Refresh every appliance of an account in a single cycle.
 
-    _appliance: Appliance
-    _eolia: PanasonicEolia
-    _appliance_status: DeviceStatus
+    The account coordinator is the only one polling the API. It wakes up
+    whenever the scheduler has an appliance due, at least once per fast poll
+    interval, and only fetches the due appliances; the others keep their
+    previous snapshot. After each cycle the refreshed snapshots are pushed
+    into the per-appliance coordinators, which the entities of all platforms
+    listen to.
+
+    A failed refresh does not take an appliance down: its last good snapshot
+    keeps being served while the next cycles retry it at the fast interval.
+    Only once that snapshot is older than stale_after its entities go
+    unavailable. Appliances that have not answered within refresh_budget are
+    given up on for the cycle and handled the same way.
+    """
 
-    # for update
-    _operation_token: str
-    _token_timestamp: datetime
-    _token_ttl: timedelta = timedelta(minutes=2)
+    _eolia: PanasonicEolia
+    appliance_coordinators: dict[str, EolliaApplianceDataCoordinator]
+    scheduler: AdaptivePollScheduler
+    # per appliance errors of the last cycle
+    errors: dict[str, Exception]
+    # appliances fetched in the last cycle
+    _refreshed: set[str]
+    _snapshot_store: EoliaSnapshotStore | None
+    stale_after: timedelta
+    refresh_budget: timedelta
 
     def __init__(
-        self, hass: HomeAssistant, eolia: PanasonicEolia, appliance: Appliance
+        self,
+        hass: HomeAssistant,
+        eolia: PanasonicEolia,
+        appliances: list[Appliance],
+        min_interval: timedelta = DEFAULT_SCAN_INTERVAL,
+        max_interval: timedelta = DEFAULT_MAX_SCAN_INTERVAL,
+        snapshot_store: EoliaSnapshotStore | None = None,
+        stale_after: timedelta = DEFAULT_STALE_AFTER,
+        refresh_budget: timedelta = DEFAULT_REFRESH_BUDGET,
     ) -> None:
         """Initialize coordinator."""
 
         self._eolia = eolia
-        self._appliance = appliance
-        self._appliance_status = None  # Initialize to prevent AttributeError
-        self._operation_token = None
-        self._token_timestamp = None
+        self.stale_after = stale_after
+        self.refresh_budget = refresh_budget
+        self._snapshot_store = snapshot_store
+        self.scheduler = AdaptivePollScheduler(min_interval, max_interval)
+        # A poll must never be answered from a status cached by the previous one
+        eolia.cache.limit_ttl(ENDPOINT_DEVICE_STATUS, min_interval.total_seconds() / 2)
+        self.appliance_coordinators = {}
+        self.errors = {}
+        self._refreshed = set()
 
         super().__init__(
             hass,
             logger=_LOGGER,
-            name="panasonic_eolia",
-            update_interval=timedelta(seconds=15),
+            name="panasonic_eolia_account",
+            update_interval=min_interval,
+        )
+
+        for appliance in appliances:
+            self.async_add_appliance(appliance)
+
+    @callback
+    def async_add_appliance(
+        self, appliance: Appliance
+    ) -> EolliaApplianceDataCoordinator | None:
+        """Start polling an appliance, it is due in the next cycle."""
+        if not appliance.appliance_id:
+            return None
+        if appliance.appliance_id in self.appliance_coordinators:
+            return self.appliance_coordinators[appliance.appliance_id]
+
+        coordinator = EolliaApplianceDataCoordinator(
+            self.hass,
+            self._eolia,
+            appliance,
+            scheduler=self.scheduler,
+            stale_after=self.stale_after,
         )
+        self.appliance_coordinators[appliance.appliance_id] = coordinator
+        self.scheduler.add(appliance.appliance_id)
+        return coordinator
+
+    async def async_remove_appliance(self, appliance_id: str) -> None:
+        """Stop polling an appliance that left the account."""
+        coordinator = self.appliance_coordinators.pop(appliance_id, None)
+        self.scheduler.remove(appliance_id)
+        self.errors.pop(appliance_id, None)
+        self._refreshed.discard(appliance_id)
+        if self.data:
+            self.data.pop(appliance_id, None)
+        if coordinator:
+            await coordinator.async_shutdown()
+
+    def _due_appliances(self) -> set[str]:
+        due = set(self.scheduler.due())
+        # Recently controlled units keep a usable operation token even when
+        # their status alone would not warrant a poll
+        due.update(
+            appliance_id
+            for appliance_id in self._eolia.operation_tokens.devices_needing_refresh()
+            if appliance_id in self.appliance_coordinators
+        )
+        return due
+
+    async def _async_update_data(self) -> dict[str, EoliaApplianceData]:
+        try:
+            return await self._async_refresh_due()
+        finally:
+            # The next cycle starts on the next appliance's poll slot, or when
+            # the paused API may be probed again
+            self.update_interval = timedelta(
+                seconds=max(self.scheduler.next_tick(), self._api_paused_for())
+            )
 
-    def _is_token_valid(self) -> bool:
-        """Check if the current operation token is still valid (within TTL)."""
-        if not self._operation_token or not self._token_timestamp:
-            return False
+    def _api_paused_for(self) -> float:
+        """Seconds the circuit breaker of the API still blocks requests."""
+        return self._eolia.circuit_breakers.breaker(EOLIA_API_BASE_URL).retry_in()
 
-        elapsed = datetime.now() - self._token_timestamp
-        return elapsed < self._token_ttl
+    async def _async_refresh_due(self) -> dict[str, EoliaApplianceData]:
+        snapshots = dict(self.data or {})
+        errors: dict[str, Exception] = {}
 
-    async def _async_setup(self):
-        """Set up the coordinator
+        if paused_for := self._api_paused_for():
+            # Polling is suspended during an outage, entities keep their state
+            _LOGGER.debug(
+                f"[AccountCoordinator] API paused for {paused_for:.0f}s, skipping cycle"
+            )
+            due = set()
+        else:
+            due = self._due_appliances()
+            _LOGGER.debug(
+                f"[AccountCoordinator] refreshing {len(due)} of {len(self.appliance_coordinators)} appliances"
+            )
+
+        if due:
+            cycle_started = time.monotonic()
+            results = await self._eolia.get_device_statuses(
+                due, timeout=self.refresh_budget.total_seconds()
+            )
 
-        This is the place to set up your coordinator,
-        or to load data, that only needs to be loaded once.
+            for appliance_id, result in results.items():
+                coordinator = self.appliance_coordinators.get(appliance_id)
+                if coordinator is None:
+                    # removed from the account while the poll was in flight
+                    continue
+                if coordinator.last_command_at > cycle_started and coordinator.data:
+                    # A command answered while this poll was in flight, its
+                    # state is newer
+                    snapshots[appliance_id] = coordinator.data
+                elif result.ok:
+                    snapshots[appliance_id] = coordinator._build_snapshot(result.status)
+                elif isinstance(result.error, CircuitOpenException):
+                    # The breaker opened during this cycle, keep the last good state
+                    continue
+                else:
+                    # The last good snapshot stays, the next cycle revalidates it
+                    self.scheduler.record_failure(appliance_id)
+                    errors[appliance_id] = result.error
+
+        # Appliances the inventory removed while the poll was in flight
+        known = self.appliance_coordinators.keys()
+        snapshots = {
+            appliance_id: snapshot
+            for appliance_id, snapshot in snapshots.items()
+            if appliance_id in known
+        }
+        errors = {
+            appliance_id: error
+            for appliance_id, error in errors.items()
+            if appliance_id in known
+        }
+        due &= known
+
+        expired = self._expire_stale(snapshots, errors)
+        self._refreshed = due | expired
+        self.errors = errors
+        if (
+            errors
+            and len(errors) == len(self.appliance_coordinators)
+            and not snapshots.keys() & errors.keys()
+        ):
+            raise UpdateFailed(
+                f"Failed to refresh any appliance: {next(iter(errors.values()))}"
+            )
 
-        This method will be called automatically during
-        coordinator.async_config_entry_first_refresh.
+        return snapshots
+
+    def _expire_stale(
+        self,
+        snapshots: dict[str, EoliaApplianceData],
+        errors: dict[str, Exception],
+    ) -> set[str]:
+        """Drop snapshots too old to be served, their entities go unavailable."""
+        expired = {
+            appliance_id
+            for appliance_id, snapshot in snapshots.items()
+            if not snapshot.is_fresh(self.stale_after)
+        }
+        for appliance_id in expired:
+            del snapshots[appliance_id]
+            errors.setdefault(
+                appliance_id,
+                UpdateFailed(
+                    f"Status of {appliance_id} is older than {self.stale_after}"
+                ),
+            )
+        return expired
+
+    @callback
+    def async_restore(
+        self, statuses: dict[str, tuple[DeviceStatus, datetime | None]]
+    ) -> None:
+        """Serve persisted statuses until the first refresh replaces them.
+
+        Restored appliances stay due, so the next cycle fetches all of them.
         """
-        _LOGGER.debug(f"[DataCoordinator] async_setup for {self._appliance.nickname}")
-        if self._appliance.appliance_id:
-            self._appliance_status = await self._eolia.get_device_status(
-                self._appliance.appliance_id
+        snapshots = {}
+        for appliance_id, (status, updated_at) in statuses.items():
+            coordinator = self.appliance_coordinators.get(appliance_id)
+            if coordinator is None:
+                continue
+            coordinator._appliance_status = status
+            snapshots[appliance_id] = EoliaApplianceData(
+                coordinator._appliance, status, updated_at
             )
 
+        _LOGGER.debug(f"[AccountCoordinator] restored {len(snapshots)} appliances")
+        self._refreshed = set(snapshots)
+        self.errors = {}
+        self.async_set_updated_data(snapshots)
+
+    @callback
+    def async_push_snapshots(self) -> None:
+        """Hand the result of the last cycle to the appliance coordinators."""
+        if not self.last_update_success:
+            for coordinator in self.appliance_coordinators.values():
+                coordinator.async_set_update_error(self.last_exception)
+            return
+
+        for appliance_id in self._refreshed:
+            coordinator = self.appliance_coordinators.get(appliance_id)
+            if coordinator is None:
+                # removed since the cycle finished
+                continue
+            if appliance_id in self.errors and appliance_id in self.data:
+                age = self.data[appliance_id].age()
+                _LOGGER.debug(
+                    f"[AccountCoordinator] serving {age} old status of {appliance_id}: {self.errors[appliance_id]}"
+                )
+            elif appliance_id in self.errors:
+                coordinator.async_set_update_error(self.errors[appliance_id])
+            elif appliance_id in self.data:
+                snapshot = self.data[appliance_id]
+                coordinator.async_set_updated_data(snapshot)
+                if self._snapshot_store and snapshot.updated_at:
+                    self._snapshot_store.async_set_status(
+                        appliance_id, snapshot.status, snapshot.updated_at
+                    )
+
+
+class EolliaApplianceDataCoordinator(DataUpdateCoordinator[EoliaApplianceData]):
+    """Class to manage fetching data."""
+
+    _appliance: Appliance
+    _eolia: PanasonicEolia
+    _appliance_status: DeviceStatus
+    _scheduler: AdaptivePollScheduler | None
+    stale_after: timedelta
+
+    # monotonic time of the last accepted command
+    last_command_at: float = 0.0
+    _unsub_verify: Callable[[], None] | None
+
+    # coalesced command queue
+    _pending_changes: dict[str, Any]
+    _pending_result: asyncio.Future[DeviceStatus | None] | None
+    _unsub_flush: Callable[[], None] | None
+    _command_lock: asyncio.Lock
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        eolia: PanasonicEolia,
+        appliance: Appliance,
+        scheduler: AdaptivePollScheduler | None = None,
+        stale_after: timedelta = DEFAULT_STALE_AFTER,
+    ) -> None:
+        """Initialize coordinator.
+
+        Appliance coordinators do not poll on their own, the account
+        coordinator feeds them through async_set_updated_data.
+        """
+
+        self._eolia = eolia
+        self.stale_after = stale_after
+        self._appliance = appliance
+        self._appliance_status = None  # Initialize to prevent AttributeError
+        self._scheduler = scheduler
+        self._unsub_verify = None
+        self._pending_changes = {}
+        self._pending_result = None
+        self._unsub_flush = None
+        self._command_lock = asyncio.Lock()
+
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            name="panasonic_eolia",
+            update_interval=None,
+        )
+
     async def submit_update_request(self, update_request: UpdateDeviceRequest):
         _LOGGER.debug(
             f"[DataCoordinator] submit_update_request for {self._appliance.nickname}"
         )
         if self._appliance.appliance_id:
-            # check if we have a valid token within TTL
-            if self._is_token_valid():
-                _LOGGER.debug(f"Using operation token: {self._operation_token}")
-                update_request.operation_token = self._operation_token
-            else:
-                _LOGGER.debug("No valid operation token available or token expired")
-                update_request.operation_token = None
+            # The status we built the request from may carry an expired token,
+            # the client fills in the freshest one it has seen for the device
+            update_request.operation_token = None
 
             try:
                 status = await self._eolia.update_device_status(
                     self._appliance.appliance_id, update_request
                 )
 
-                # if we receive a token back, we store it with timestamp
-                if status and status.operation_token:
-                    _LOGGER.debug(f"Received operation token: {status.operation_token}")
-                    self._operation_token = status.operation_token
-                    self._token_timestamp = datetime.now()
+                # The PUT answers with the full new state, publish it right away
+                # and only verify once after the last command of a burst
+                if status is not None:
+                    self.last_command_at = time.monotonic()
+                    if self._scheduler:
+                        self._scheduler.record_command(self._appliance.appliance_id)
+                    self.async_set_updated_data(self._build_snapshot(status))
+                self._schedule_verify_refresh()
 
                 return status
             except DeviceLockedByAnotherControllerException:
                 _LOGGER.warning(
                     f"Device {self._appliance.nickname} is locked by another controller. Please wait 2 minutes."
                 )
-                # Clear our token since it's invalid
-                self._operation_token = None
-                self._token_timestamp = None
                 # Re-raise the exception to be handled by the climate entity
                 raise
 
+    @callback
+    def _schedule_verify_refresh(self) -> None:
+        """Replace any pending verification poll with one after the delay."""
+        if self._unsub_verify:
+            self._unsub_verify()
+        self._unsub_verify = async_call_later(
+            self.hass, COMMAND_VERIFY_DELAY, self._async_verify_refresh
+        )
+
+    async def _async_verify_refresh(self, _now: datetime) -> None:
+        self._unsub_verify = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending verification poll and queued commands."""
+        if self._unsub_verify:
+            self._unsub_verify()
+            self._unsub_verify = None
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if self._pending_result and not self._pending_result.done():
+            self._pending_result.cancel()
+        self._pending_result = None
+        self._pending_changes = {}
+        await super().async_shutdown()
+
+    def _build_snapshot(self, status: DeviceStatus) -> EoliaApplianceData:
+        """Store a freshly fetched status and wrap it for the entities."""
+        self._appliance_status = status
+        if self._scheduler and self._appliance.appliance_id:
+            self._scheduler.record_status(self._appliance.appliance_id, status)
+        return EoliaApplianceData(
+            self._appliance, self._appliance_status, dt_util.utcnow()
+        )
+
     async def _async_update_data(self):
         _LOGGER.debug(f"[DataCoordinator] async_update for {self._appliance.nickname}")
         if self._appliance.appliance_id:
-            self._appliance_status = await self._eolia.get_device_status(
-                self._appliance.appliance_id
-            )
+            try:
+                status = await self._eolia.get_device_status(
+                    self._appliance.appliance_id
+                )
+            except Exception as exc:
+                return self._serve_stale(exc)
+            if status is None:
+                return self._serve_stale(
+                    DeviceStatusUnavailableException(self._appliance.appliance_id)
+                )
+            return self._build_snapshot(status)
 
         return EoliaApplianceData(self._appliance, self._appliance_status)
 
-    async def _async_set_temperature(self, temperature: int):
+    def _serve_stale(self, error: Exception) -> EoliaApplianceData:
+        """Keep the last good snapshot after a failed refresh while it is fresh."""
+        if self.data is None or not self.data.is_fresh(self.stale_after):
+            raise UpdateFailed(
+                f"Failed to refresh {self._appliance.nickname}: {error}"
+            ) from error
         _LOGGER.debug(
-            f"[DataCoordinator] async_set_temperature for {self._appliance.nickname}"
+            f"[DataCoordinator] serving {self.data.age()} old status of {self._appliance.nickname}: {error}"
+        )
+        return self.data
+
+    async def _async_queue_changes(
+        self, changes: dict[str, Any]
+    ) -> DeviceStatus | None:
+        """Merge changes into the pending command and wait for its PUT.
+
+        Every change queued within COMMAND_COALESCE_WINDOW of the first one is
+        sent as a single update request, later values win.
+        """
+        self._pending_changes.update(changes)
+        if self._pending_result is None:
+            self._pending_result = self.hass.loop.create_future()
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, COMMAND_COALESCE_WINDOW, self._async_flush_changes
+            )
+        return await asyncio.shield(self._pending_result)
+
+    async def _async_flush_changes(self, _now: datetime | None = None) -> None:
+        self._unsub_flush = None
+        changes, self._pending_changes = self._pending_changes, {}
+        result, self._pending_result = self._pending_result, None
+        if result is None:
+            return
+
+        # Serialize PUTs so a batch is built on the state returned by the
+        # previous one rather than on whatever was polled before it
+        async with self._command_lock:
+            try:
+                status = await self._async_submit_changes(changes)
+            except Exception as exc:
+                if not result.done():
+                    result.set_exception(exc)
+            else:
+                if not result.done():
+                    result.set_result(status)
+
+    async def _async_submit_changes(
+        self, changes: dict[str, Any]
+    ) -> DeviceStatus | None:
+        _LOGGER.debug(
+            f"[DataCoordinator] submitting {changes} for {self._appliance.nickname}"
         )
 
         # Ensure we have a valid status before trying to update
@@ -157,124 +550,53 @@ class EolliaApplianceDataCoordinator(DataUpdateCoordinator[EoliaApplianceData]):
                 return None
 
         update_request = self._appliance_status.to_update_request()
-        update_request.temperature = temperature
+        for field, value in changes.items():
+            setattr(update_request, field, value)
         return await self.submit_update_request(update_request)
 
+    async def _async_set_temperature(self, temperature: int):
+        _LOGGER.debug(
+            f"[DataCoordinator] async_set_temperature for {self._appliance.nickname}"
+        )
+        return await self._async_queue_changes({"temperature": temperature})
+
     async def _async_set_off(self):
         _LOGGER.debug(f"[DataCoordinator] async_set_off for {self._appliance.nickname}")
-
-        if self._appliance_status is None:
-            _LOGGER.warning(
-                f"[DataCoordinator] No status available for {self._appliance.nickname}, fetching current status"
-            )
-            if self._appliance.appliance_id:
-                self._appliance_status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-
-        update_request = self._appliance_status.to_update_request()
-        update_request.operation_status = False
-        return await self.submit_update_request(update_request)
+        return await self._async_queue_changes({"operation_status": False})
 
     async def _async_set_hvac_mode(self, operation_mode: str, operation_status: bool):
         _LOGGER.debug(
             f"[DataCoordinator] async_set_hvac_mode for {self._appliance.nickname}: mode={operation_mode}, status={operation_status}"
         )
-
-        if self._appliance_status is None:
-            _LOGGER.warning(
-                f"[DataCoordinator] No status available for {self._appliance.nickname}, fetching current status"
-            )
-            if self._appliance.appliance_id:
-                self._appliance_status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-
-            if self._appliance_status is None:
-                _LOGGER.error(
-                    f"[DataCoordinator] Failed to get status for {self._appliance.nickname}"
-                )
-                return None
-
-        update_request = self._appliance_status.to_update_request()
-        update_request.operation_mode = operation_mode
-        update_request.operation_status = operation_status
-        return await self.submit_update_request(update_request)
+        return await self._async_queue_changes(
+            {"operation_mode": operation_mode, "operation_status": operation_status}
+        )
 
     async def _async_set_fan_mode(self, wind_volume: int = None, air_flow: str = None):
         _LOGGER.debug(
             f"[DataCoordinator] async_set_fan_mode for {self._appliance.nickname}: wind_volume={wind_volume}, air_flow={air_flow}"
         )
 
-        if self._appliance_status is None:
-            _LOGGER.warning(
-                f"[DataCoordinator] No status available for {self._appliance.nickname}, fetching current status"
-            )
-            if self._appliance.appliance_id:
-                self._appliance_status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-
-            if self._appliance_status is None:
-                _LOGGER.error(
-                    f"[DataCoordinator] Failed to get status for {self._appliance.nickname}"
-                )
-                return None
-
-        update_request = self._appliance_status.to_update_request()
+        changes = {}
         if wind_volume is not None:
-            update_request.wind_volume = wind_volume
+            changes["wind_volume"] = wind_volume
         if air_flow is not None:
-            update_request.air_flow = air_flow
-        return await self.submit_update_request(update_request)
+            changes["air_flow"] = air_flow
+        return await self._async_queue_changes(changes)
 
     async def _async_set_swing_mode(self, wind_direction: int):
         _LOGGER.debug(
             f"[DataCoordinator] async_set_swing_mode for {self._appliance.nickname}: wind_direction={wind_direction}"
         )
-
-        if self._appliance_status is None:
-            _LOGGER.warning(
-                f"[DataCoordinator] No status available for {self._appliance.nickname}, fetching current status"
-            )
-            if self._appliance.appliance_id:
-                self._appliance_status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-
-            if self._appliance_status is None:
-                _LOGGER.error(
-                    f"[DataCoordinator] Failed to get status for {self._appliance.nickname}"
-                )
-                return None
-
-        update_request = self._appliance_status.to_update_request()
-        update_request.wind_direction = wind_direction
-        return await self.submit_update_request(update_request)
+        return await self._async_queue_changes({"wind_direction": wind_direction})
 
     async def _async_set_preset_mode(self, air_flow: str):
         _LOGGER.debug(
             f"[DataCoordinator] async_set_preset_mode for {self._appliance.nickname}: air_flow={air_flow}"
         )
 
-        if self._appliance_status is None:
-            _LOGGER.warning(
-                f"[DataCoordinator] No status available for {self._appliance.nickname}, fetching current status"
-            )
-            if self._appliance.appliance_id:
-                self._appliance_status = await self._eolia.get_device_status(
-                    self._appliance.appliance_id
-                )
-
-            if self._appliance_status is None:
-                _LOGGER.error(
-                    f"[DataCoordinator] Failed to get status for {self._appliance.nickname}"
-                )
-                return None
-
-        update_request = self._appliance_status.to_update_request()
-        update_request.air_flow = air_flow
+        changes = {"air_flow": air_flow}
         # When setting preset, we should reset wind_volume to auto
         if air_flow in ["quiet", "powerful"]:
-            update_request.wind_volume = 0  # AUTO
-        return await self.submit_update_request(update_request)
+            changes["wind_volume"] = 0  # AUTO
+        return await self._async_queue_changes(changes)
@@ -0,0 +1,130 @@
+"""Cached appliance inventory of a Panasonic Eolia account."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from custom_components.panasonic_eolia.capabilities import EoliaCapabilityCache
+from custom_components.panasonic_eolia.const import (
+    INVENTORY_REFRESH_INTERVAL,
+    SIGNAL_APPLIANCES_ADDED,
+)
+from custom_components.panasonic_eolia.eolia.auth import PanasonicEolia
+from custom_components.panasonic_eolia.eolia.device import Appliance
+from custom_components.panasonic_eolia.eolia.exceptions import PanasonicEoliaException
+from custom_components.panasonic_eolia.eolia_data import (
+    EoliaAccountDataCoordinator,
+    PanasonicEoliaConfigEntry,
+)
+from custom_components.panasonic_eolia.storage import EoliaSnapshotStore
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.DEBUG)
+
+
+class EoliaInventory:
+    """Keep the appliance list of an entry in sync with the cloud.
+
+    The inventory starts from the stored list and re-checks the devices
+    endpoint every INVENTORY_REFRESH_INTERVAL. Added appliances get their
+    coordinator and entities, removed ones are dropped from polling and from
+    the entity registry, all without reloading the entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: PanasonicEoliaConfigEntry,
+        eolia: PanasonicEolia,
+        coordinator: EoliaAccountDataCoordinator,
+        appliances: list[Appliance],
+        snapshot_store: EoliaSnapshotStore,
+        capabilities: EoliaCapabilityCache,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._eolia = eolia
+        self._coordinator = coordinator
+        # shared with EoliaData, updated in place
+        self.appliances = appliances
+        self._snapshot_store = snapshot_store
+        self._capabilities = capabilities
+
+    @callback
+    def async_start(self) -> None:
+        """Re-check the inventory on a slow schedule until the entry unloads."""
+        self._entry.async_on_unload(
+            async_track_time_interval(
+                self._hass, self._async_scheduled_refresh, INVENTORY_REFRESH_INTERVAL
+            )
+        )
+
+    async def _async_scheduled_refresh(self, _now: datetime) -> None:
+        try:
+            await self.async_refresh()
+        except (PanasonicEoliaException, asyncio.TimeoutError) as exc:
+            # transport, API and circuit breaker errors, retried next interval
+            _LOGGER.warning(f"Inventory refresh failed: {exc!r}")
+
+    async def async_refresh(self) -> None:
+        """Fetch the appliance list and apply additions and removals."""
+        devices = await self._eolia.get_devices()
+        if devices is None:
+            _LOGGER.debug("Could not fetch the appliance list, keeping the cached one")
+            return
+
+        known = {appliance.appliance_id: appliance for appliance in self.appliances}
+        fetched = {
+            appliance.appliance_id: appliance
+            for appliance in devices
+            if appliance.appliance_id
+        }
+        added = [fetched[key] for key in fetched.keys() - known.keys()]
+        removed = [known[key] for key in known.keys() - fetched.keys()]
+        if not added and not removed:
+            return
+
+        for appliance in removed:
+            _LOGGER.info(f"Appliance {appliance.nickname} left the account")
+            await self._async_remove(appliance)
+        for appliance in added:
+            _LOGGER.info(f"Discovered new appliance {appliance.nickname}")
+            self._coordinator.async_add_appliance(appliance)
+
+        self.appliances[:] = [
+            appliance for appliance in self.appliances if appliance not in removed
+        ] + added
+        self._snapshot_store.async_set_appliances(self.appliances)
+
+        if added:
+            # Seed the new appliances and their models before their entities
+            # are created
+            await asyncio.gather(
+                self._coordinator.async_refresh(),
+                self._capabilities.async_ensure(
+                    self._eolia, {appliance.product_code for appliance in added}
+                ),
+            )
+            async_dispatcher_send(
+                self._hass, SIGNAL_APPLIANCES_ADDED.format(self._entry.entry_id), added
+            )
+
+    async def _async_remove(self, appliance: Appliance) -> None:
+        await self._coordinator.async_remove_appliance(appliance.appliance_id)
+
+        registry = er.async_get(self._hass)
+        for registry_entry in er.async_entries_for_config_entry(
+            registry, self._entry.entry_id
+        ):
+            unique_id = registry_entry.unique_id
+            if unique_id == appliance.appliance_id or unique_id.startswith(
+                f"{appliance.appliance_id}_"
+            ):
+                registry.async_remove(registry_entry.entity_id)
@@ -0,0 +1,173 @@
+"""Adaptive poll scheduling for Panasonic Eolia appliances."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from custom_components.panasonic_eolia.const import (
+    COMMAND_FAST_POLL_WINDOW,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+)
+from custom_components.panasonic_eolia.eolia.responses import (
+    DeviceStatus,
+    OperationMode,
+)
+
+# Units that are running but holding their temperature are polled this much
+# slower than the fast interval
+STEADY_INTERVAL_FACTOR = 2
+
+# Growth of the poll interval for every idle poll of a unit that is off
+IDLE_BACKOFF_FACTOR = 2
+
+# Appliances due within this many seconds are folded into the current cycle
+DUE_TOLERANCE = 1.0
+
+# Random shift of every poll, as a fraction of the appliance's interval
+POLL_JITTER_FRACTION = 0.05
+
+
+@dataclass
+class _PollState:
+    interval: float
+    # position of the polls within the interval, as a fraction of it
+    phase: float = 0.0
+    next_due: float = 0.0
+    last_command: float | None = None
+    last_inside_temp: float | None = None
+
+
+class AdaptivePollScheduler:
+    """Decide per appliance how often it needs to be polled.
+
+    Appliances are polled at the fast interval right after a command and
+    while they are running with a changing inside temperature. Running
+    appliances holding their temperature are polled a bit slower, and
+    appliances that are off back off exponentially up to the slow interval.
+
+    Polls are spread over the interval: every appliance gets its own phase,
+    evenly spaced and shifted by a random offset per account, and is always
+    due on its phase-aligned slot (plus a little jitter). The phase is kept
+    as a fraction of the interval, so it survives interval changes.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta = DEFAULT_SCAN_INTERVAL,
+        max_interval: timedelta = DEFAULT_MAX_SCAN_INTERVAL,
+        command_window: timedelta = COMMAND_FAST_POLL_WINDOW,
+    ) -> None:
+        self.min_interval = min_interval.total_seconds()
+        self.max_interval = max(self.min_interval, max_interval.total_seconds())
+        self.command_window = command_window.total_seconds()
+        self._states: dict[str, _PollState] = {}
+        self._epoch = time.monotonic()
+        # shifts all phases so several accounts do not poll in lock-step
+        self._phase_offset = random.random()
+
+    def _state(self, appliance_id: str) -> _PollState:
+        if appliance_id not in self._states:
+            self._states[appliance_id] = _PollState(interval=self.min_interval)
+        return self._states[appliance_id]
+
+    def add(self, appliance_id: str) -> None:
+        """Track an appliance, it is due immediately."""
+        self._state(appliance_id)
+        self._spread_phases()
+
+    def remove(self, appliance_id: str) -> None:
+        self._states.pop(appliance_id, None)
+        self._spread_phases()
+
+    def _spread_phases(self) -> None:
+        count = len(self._states)
+        for index, state in enumerate(self._states.values()):
+            state.phase = (self._phase_offset + index / count) % 1.0
+
+    def _next_slot(self, state: _PollState, now: float, interval: float) -> float:
+        """First phase-aligned slot at least half an interval from now."""
+        anchor = self._epoch + state.phase * interval
+        slot = anchor + math.ceil((now - anchor) / interval) * interval
+        if slot - now < interval / 2:
+            slot += interval
+        jitter = random.uniform(-1.0, 1.0) * POLL_JITTER_FRACTION * interval
+        return slot + jitter
+
+    def interval(self, appliance_id: str) -> float:
+        return self._state(appliance_id).interval
+
+    def record_command(self, appliance_id: str) -> None:
+        """Switch an appliance to fast polling after a command."""
+        state = self._state(appliance_id)
+        state.last_command = time.monotonic()
+        state.interval = self.min_interval
+        state.next_due = min(
+            state.next_due,
+            self._next_slot(state, state.last_command, self.min_interval),
+        )
+
+    def record_status(self, appliance_id: str, status: DeviceStatus | None) -> None:
+        """Adapt the interval of an appliance to the status it just reported."""
+        now = time.monotonic()
+        state = self._state(appliance_id)
+        state.interval = self._next_interval(state, status, now)
+        state.next_due = self._next_slot(state, now, state.interval)
+        if status is not None:
+            state.last_inside_temp = status.inside_temp
+
+    def record_failure(self, appliance_id: str) -> None:
+        """Retry a failed appliance at the fast interval."""
+        state = self._state(appliance_id)
+        state.next_due = self._next_slot(state, time.monotonic(), self.min_interval)
+
+    def _next_interval(
+        self, state: _PollState, status: DeviceStatus | None, now: float
+    ) -> float:
+        if status is None:
+            return self.min_interval
+
+        if (
+            state.last_command is not None
+            and now - state.last_command < self.command_window
+        ):
+            return self.min_interval
+
+        is_off = not status.operation_status or status.operation_mode in (
+            OperationMode.OFF,
+            OperationMode.STOP,
+        )
+        if is_off:
+            return min(
+                self.max_interval,
+                max(state.interval * IDLE_BACKOFF_FACTOR, self.min_interval),
+            )
+
+        if (
+            state.last_inside_temp is None
+            or status.inside_temp != state.last_inside_temp
+        ):
+            return self.min_interval
+
+        return min(self.max_interval, self.min_interval * STEADY_INTERVAL_FACTOR)
+
+    def due(self, now: float | None = None) -> list[str]:
+        """Appliances that should be polled in this cycle."""
+        now = time.monotonic() if now is None else now
+        return [
+            appliance_id
+            for appliance_id, state in self._states.items()
+            if state.next_due <= now + DUE_TOLERANCE
+        ]
+
+    def next_tick(self, now: float | None = None) -> float:
+        """Seconds until the next appliance is due, at most the fast interval."""
+        now = time.monotonic() if now is None else now
+        if not self._states:
+            return self.min_interval
+        next_due = min(state.next_due for state in self._states.values())
+        return min(self.min_interval, max(DUE_TOLERANCE, next_due - now))
@@ -1,6 +1,8 @@
 """Sensor platform for Panasonic Eolia integration."""
 
 import logging
+import time
+from datetime import timedelta
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -9,9 +11,17 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from custom_components.panasonic_eolia.capabilities import FUNCTION_INSIDE_TEMP
+from custom_components.panasonic_eolia.const import (
+    SENSOR_MAX_SILENCE,
+    SENSOR_MIN_PUBLISH_INTERVAL,
+    SENSOR_TEMPERATURE_DEADBAND,
+    SIGNAL_APPLIANCES_ADDED,
+)
+from custom_components.panasonic_eolia.entity import EoliaStatusEntity
 from custom_components.panasonic_eolia.eolia.auth import PanasonicEolia
 from custom_components.panasonic_eolia.eolia.device import Appliance
 from custom_components.panasonic_eolia.eolia.responses import DeviceStatus
@@ -34,39 +44,74 @@ async def async_setup_entry(
         f"Sensor async_setup_entry called, num devices: {len(entry.runtime_data.appliances)}"
     )
 
-    entities = []
-    for device in entry.runtime_data.appliances:
-        coordinator = EolliaApplianceDataCoordinator(
-            hass, entry.runtime_data.eolia, device
-        )
-        _LOGGER.info(f"creating temperature sensor for {device.nickname}")
-
-        entity = PanasonicEoliaTemperatureSensor(
-            coordinator=coordinator, appliance=device, eolia=entry.runtime_data.eolia
+    @callback
+    def _async_add_appliances(appliances: list[Appliance]) -> None:
+        entities = []
+        for device in appliances:
+            coordinator = entry.runtime_data.coordinator.appliance_coordinators.get(
+                device.appliance_id
+            )
+            if coordinator is None:
+                continue
+            if not entry.runtime_data.capabilities.supports(
+                device.product_code, FUNCTION_INSIDE_TEMP
+            ):
+                _LOGGER.info(f"{device.nickname} has no temperature sensor")
+                continue
+            _LOGGER.info(f"creating temperature sensor for {device.nickname}")
+
+            entity = PanasonicEoliaTemperatureSensor(
+                coordinator=coordinator,
+                appliance=device,
+                eolia=entry.runtime_data.eolia,
+            )
+            entities.append(entity)
+
+        async_add_entities(entities)
+
+    _async_add_appliances(entry.runtime_data.appliances)
+
+    # Appliances discovered later by the inventory
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_APPLIANCES_ADDED.format(entry.entry_id),
+            _async_add_appliances,
         )
-        entities.append(entity)
+    )
 
-    async_add_entities(entities)
 
+class PanasonicEoliaTemperatureSensor(EoliaStatusEntity, SensorEntity):
+    """Representation of a Panasonic Eolia temperature sensor.
 
-class PanasonicEoliaTemperatureSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Panasonic Eolia temperature sensor."""
+    The published value only follows the reported one when it moved by at
+    least the deadband and the minimum publish interval has passed. Smaller
+    drifts are published once the max silence is over.
+    """
 
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _status_fields = frozenset({"inside_temp"})
 
     _appliance: Appliance
     _eolia: PanasonicEolia
-    _last_device_status: DeviceStatus
+    _last_device_status: DeviceStatus | None
     _coordinator: EolliaApplianceDataCoordinator
 
+    # value in the state machine and monotonic time it was written
+    _published_value: float | None
+    _published_at: float
+
     def __init__(
         self,
         coordinator: EolliaApplianceDataCoordinator,
         appliance: Appliance,
         eolia: PanasonicEolia,
+        deadband: float = SENSOR_TEMPERATURE_DEADBAND,
+        min_publish_interval: timedelta = SENSOR_MIN_PUBLISH_INTERVAL,
+        max_silence: timedelta = SENSOR_MAX_SILENCE,
     ) -> None:
         """Initialize the temperature sensor."""
         _LOGGER.debug(
@@ -82,25 +127,42 @@ class PanasonicEoliaTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._appliance = appliance
         self._coordinator = coordinator
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            f"Temperature sensor handle_coordinator_update called for {self._appliance.nickname}"
-        )
-        if self.coordinator.data:
-            self._last_device_status = self.coordinator.data.status
-        self.async_write_ha_state()
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        self._deadband = deadband
+        self._min_publish_interval = min_publish_interval.total_seconds()
+        self._max_silence = max_silence.total_seconds()
+        self._published_value = self._reported_value()
+        self._published_at = time.monotonic()
+
+    def _reported_value(self) -> float | None:
+        if self._last_device_status is None:
+            return None
+        return self._last_device_status.inside_temp
+
+    def _should_write_state(self, changed: set[str]) -> bool:
+        """Publish meaningful changes, rate limited, and drifts after silence."""
+        value = self._reported_value()
+        if value is None or value == self._published_value:
+            return False
+
+        since_publish = time.monotonic() - self._published_at
+        if self._published_value is None:
+            publish = True
+        elif since_publish >= self._max_silence:
+            publish = True
+        else:
+            publish = (
+                abs(value - self._published_value) >= self._deadband
+                and since_publish >= self._min_publish_interval
+            )
+
+        if publish:
+            self._published_value = value
+            self._published_at = time.monotonic()
+        return publish
 
     @property
     def native_value(self) -> float:
         """Return the current temperature value."""
-        if self._coordinator and self._coordinator._appliance_status:
-            if self._coordinator._appliance_status.inside_temp:
-                return self._coordinator._appliance_status.inside_temp
+        if self._published_value:
+            return self._published_value
         return 0
@@ -0,0 +1,94 @@
+"""Persisted last-known state of a Panasonic Eolia account."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.panasonic_eolia.const import DOMAIN
+from custom_components.panasonic_eolia.eolia.device import Appliance
+from custom_components.panasonic_eolia.eolia.responses import DeviceStatus
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.DEBUG)
+
+STORAGE_VERSION = 1
+
+# Statuses change on every poll, writes are batched over this many seconds
+STORAGE_SAVE_DELAY = 60
+
+
+class EoliaSnapshotStore:
+    """Persist the appliance list and the last status of every appliance.
+
+    The snapshot lets the integration come up with stale-but-usable state
+    right after a restart, before the cloud has answered a single request.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._appliances: list[dict[str, Any]] = []
+        self._statuses: dict[str, dict[str, Any]] = {}
+
+    async def async_load(
+        self,
+    ) -> tuple[list[Appliance], dict[str, tuple[DeviceStatus, datetime | None]]]:
+        """Return the stored appliances and their statuses with fetch time."""
+        data = await self._store.async_load()
+        if not data:
+            return [], {}
+
+        self._appliances = data.get("appliances", [])
+        self._statuses = data.get("statuses", {})
+
+        appliances = [Appliance.from_dict(item) for item in self._appliances]
+        statuses = {}
+        for appliance_id, item in self._statuses.items():
+            try:
+                statuses[appliance_id] = (
+                    DeviceStatus.from_dict(item["status"]),
+                    dt_util.parse_datetime(item.get("updated_at") or ""),
+                )
+            except (KeyError, TypeError) as exc:
+                _LOGGER.debug(f"Ignoring stored status of {appliance_id}: {exc}")
+
+        return appliances, statuses
+
+    @callback
+    def async_set_appliances(self, appliances: list[Appliance]) -> None:
+        self._appliances = [appliance.to_dict() for appliance in appliances]
+        known_ids = {appliance.appliance_id for appliance in appliances}
+        self._statuses = {
+            appliance_id: item
+            for appliance_id, item in self._statuses.items()
+            if appliance_id in known_ids
+        }
+        self._async_schedule_save()
+
+    @callback
+    def async_set_status(
+        self, appliance_id: str, status: DeviceStatus, updated_at: datetime
+    ) -> None:
+        self._statuses[appliance_id] = {
+            "status": status.to_dict(),
+            "updated_at": updated_at.isoformat(),
+        }
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"appliances": self._appliances, "statuses": self._statuses}
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()